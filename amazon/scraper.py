@@ -4,21 +4,40 @@ Amazon商品情報スクレイパー
 共通のBaseScraperを継承してAmazon専用の実装を行います。
 """
 
-import sys
-from pathlib import Path
 from typing import List, Dict, Optional, Any
 import re
 
-# 親ディレクトリのパスを追加して共通モジュールをインポート
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from common.base_scraper import BaseScraper
 
+# ホットループで毎回組み立てないよう、モジュールレベルでコンパイル済みの正規表現を用意
+_DP_RE = re.compile(r'/dp/([A-Z0-9]{10})')              # /dp/B08XXXXXXX
+_GP_RE = re.compile(r'/gp/product/([A-Z0-9]{10})')      # /gp/product/B08XXXXXXX
+_EXCLUDE_RE = re.compile(r'/help|/gp/help|/customer|/ap/signin|/ref=')
+_PRICE_RE = re.compile(r'[\d,]+')
+
 
 class AmazonScraper(BaseScraper):
     """
     Amazonの商品情報をスクレイピングするクラス
     """
-    
+
+    # 詳細ページの抽出セレクタ（商品ごとに組み立て直さないようクラスレベルで定義）
+    _TITLE_SELECTORS = ("#productTitle", "h1.a-size-large", "h1")
+    _PRICE_SELECTORS = (
+        ".a-price-whole",
+        "#priceblock_ourprice",
+        "#priceblock_dealprice",
+        ".a-price .a-offscreen",
+        "span.a-price",
+    )
+    _IMAGE_SELECTORS = ("#landingImage", "#imgBlkFront")
+
+    # クッキー同意ボタン（全パターンを1つのユニオンセレクタにまとめて1回で探す）
+    _COOKIE_SELECTOR = (
+        'button:has-text("Accept"), button:has-text("同意"), '
+        '#sp-cc-accept, .a-button-primary:has-text("Accept")'
+    )
+
     def scrape_list(self, url: str, wait_time: int = 3000) -> List[str]:
         """
         商品一覧ページから商品リンクを取得
@@ -30,8 +49,9 @@ class AmazonScraper(BaseScraper):
         Output:
             List[str]: 商品詳細ページのURLリスト
         """
-        page = self.get_page()
+        page = self.get_page(block_resources=True)
         item_links = []
+        seen = set()  # O(1)の重複チェック用
 
         try:
             print(f"商品一覧ページにアクセス中: {url}")
@@ -41,36 +61,26 @@ class AmazonScraper(BaseScraper):
                 print(f"  警告: ページ読み込みでエラーが発生しました: {e}")
                 print("  続行します...")
             
-            page.wait_for_timeout(wait_time * 2)
-            
-            # クッキー同意ボタンをクリック
+            # クッキー同意ボタンをクリック（count()で即時判定するため、
+            # バナーが無い通常ケースではタイムアウトを一切待たない）
             try:
-                cookie_selectors = [
-                    'button:has-text("Accept")',
-                    'button:has-text("同意")',
-                    '#sp-cc-accept',
-                    '.a-button-primary:has-text("Accept")',
-                ]
-                for selector in cookie_selectors:
-                    try:
-                        cookie_button = page.locator(selector).first
-                        if cookie_button.count() > 0:
-                            cookie_button.click()
-                            print("  クッキー同意ボタンをクリックしました")
-                            page.wait_for_timeout(1000)
-                            break
-                    except:
-                        continue
+                cookie_button = page.locator(self._COOKIE_SELECTOR).first
+                if cookie_button.count() > 0:
+                    cookie_button.click(timeout=500, no_wait_after=True)
+                    print("  クッキー同意ボタンをクリックしました")
             except:
                 pass
-            
-            # 商品リンクが表示されるまで待機
+
+            # 商品リンクが表示されるまでイベント駆動で待機（固定スリープは使わない）
             print("  商品リンクの読み込みを待機中...")
             try:
                 page.wait_for_selector("a[href*='/dp/'], a[href*='/gp/product/']", timeout=15000)
             except:
-                print("  商品リンクの自動検出に失敗しました。追加の待機時間を設定します...")
-                page.wait_for_timeout(5000)
+                print("  商品リンクの自動検出に失敗しました。ネットワークアイドルまで待機します...")
+                try:
+                    page.wait_for_load_state("networkidle", timeout=5000)
+                except:
+                    pass
             
             # Amazonの商品リンクを取得するセレクタ
             selectors = [
@@ -80,81 +90,59 @@ class AmazonScraper(BaseScraper):
                 ".s-result-item a[href*='/dp/']",  # 検索結果内のリンク
             ]
             
-            # 除外するURLパターン
-            exclude_patterns = [
-                "/help",
-                "/gp/help",
-                "/customer",
-                "/ap/signin",
-                "/ref=",
-            ]
-            
-            for selector in selectors:
-                try:
-                    links = page.locator(selector).all()
-                    if links:
-                        print(f"セレクタ '{selector}' で {len(links)} 件のリンクを発見")
-                        for link in links:
-                            try:
-                                href = link.get_attribute("href")
-                                if not href:
-                                    continue
-                                
-                                # デバッグ用：最初の数件のhrefを表示
-                                if len(item_links) < 3:
-                                    print(f"  デバッグ: href = {href}")
-                                
-                                # Amazon商品リンクパターンを検出
-                                if "/dp/" in href or "/gp/product/" in href:
-                                    # 除外パターンをチェック
-                                    should_exclude = any(pattern in href for pattern in exclude_patterns)
-                                    if should_exclude:
-                                        continue
-                                    
-                                    # 商品IDパターンをチェック
-                                    item_id_patterns = [
-                                        r'/dp/([A-Z0-9]{10})',      # /dp/B08XXXXXXX
-                                        r'/gp/product/([A-Z0-9]{10})',  # /gp/product/B08XXXXXXX
-                                    ]
-                                    
-                                    matched = False
-                                    for pattern in item_id_patterns:
-                                        if re.search(pattern, href):
-                                            matched = True
-                                            break
-                                    
-                                    if matched:
-                                        # フルURLに変換
-                                        if href.startswith("http"):
-                                            full_url = href.split("?")[0].split("#")[0]  # クエリパラメータを除去
-                                        elif href.startswith("/"):
-                                            full_url = f"https://www.amazon.co.jp{href.split('?')[0].split('#')[0]}"
-                                        else:
-                                            continue
-                                        
-                                        # 重複チェック
-                                        if full_url not in item_links:
-                                            item_links.append(full_url)
-                                            print(f"  商品リンク {len(item_links)}: {full_url}")
-                            
-                            except Exception as e:
-                                print(f"  リンク処理エラー: {e}")
-                                continue
-                        
-                        if item_links:
-                            print(f"合計 {len(item_links)} 件の商品リンクを発見")
-                            break
-                
-                except Exception as e:
-                    print(f"セレクタ '{selector}' でエラー: {e}")
+            # 全セレクタ分のhrefを1回のJS評価でまとめて取得
+            # （リンクごとのget_attribute往復をなくし、CDP呼び出しを1回に集約）
+            try:
+                hrefs = page.eval_on_selector_all(
+                    ", ".join(selectors),
+                    "els => Array.from(new Set(els.map(e => e.getAttribute('href'))))"
+                )
+            except Exception as e:
+                print(f"リンク取得でエラー: {e}")
+                hrefs = []
+
+            if hrefs:
+                print(f"{len(hrefs)} 件のリンク候補を発見")
+
+            for href in hrefs:
+                if not href:
                     continue
+
+                # デバッグ用：最初の数件のhrefを表示
+                if len(item_links) < 3:
+                    print(f"  デバッグ: href = {href}")
+
+                # Amazon商品リンクパターンを検出
+                if "/dp/" in href or "/gp/product/" in href:
+                    # 除外パターンをチェック
+                    if _EXCLUDE_RE.search(href):
+                        continue
+
+                    # 商品IDパターンをチェック
+                    if _DP_RE.search(href) or _GP_RE.search(href):
+                        # フルURLに変換
+                        if href.startswith("http"):
+                            full_url = href.split("?")[0].split("#")[0]  # クエリパラメータを除去
+                        elif href.startswith("/"):
+                            full_url = f"https://www.amazon.co.jp{href.split('?')[0].split('#')[0]}"
+                        else:
+                            continue
+
+                        # 重複チェック
+                        if full_url not in seen:
+                            seen.add(full_url)
+                            item_links.append(full_url)
+                            print(f"  商品リンク {len(item_links)}: {full_url}")
+
+            if item_links:
+                print(f"合計 {len(item_links)} 件の商品リンクを発見")
         
         except Exception as e:
             print(f"エラー: {e}")
             import traceback
             traceback.print_exc()
         finally:
-            page.context.close()
+            self.release_page(page)
         
         return item_links
     
@@ -169,7 +157,7 @@ class AmazonScraper(BaseScraper):
         Output:
             Dict[str, Any]: 商品情報の辞書
         """
-        page = self.get_page()
+        page = self.get_page(block_resources=True)
         
         try:
             print(f"\n商品詳細ページにアクセス中: {item_url}")
@@ -179,24 +167,22 @@ class AmazonScraper(BaseScraper):
                 print(f"  警告: ページ読み込みでエラーが発生しました: {e}")
                 return None
             
-            page.wait_for_timeout(wait_time)
-            
-            # クッキー同意ボタンをクリック
+            # 商品タイトルが描画されるまでイベント駆動で待機（固定スリープは使わない）
             try:
-                cookie_selectors = [
-                    'button:has-text("Accept")',
-                    '#sp-cc-accept',
-                ]
-                for selector in cookie_selectors:
-                    try:
-                        cookie_button = page.locator(selector).first
-                        if cookie_button.count() > 0:
-                            cookie_button.click()
-                            print("  クッキー同意ボタンをクリックしました")
-                            page.wait_for_timeout(1000)
-                            break
-                    except:
-                        continue
+                page.wait_for_selector("#productTitle, h1", timeout=15000)
+            except:
+                try:
+                    page.wait_for_load_state("networkidle", timeout=5000)
+                except:
+                    pass
+
+            # クッキー同意ボタンをクリック（count()で即時判定するため、
+            # バナーが無い通常ケースではタイムアウトを一切待たない）
+            try:
+                cookie_button = page.locator(self._COOKIE_SELECTOR).first
+                if cookie_button.count() > 0:
+                    cookie_button.click(timeout=500, no_wait_after=True)
+                    print("  クッキー同意ボタンをクリックしました")
             except:
                 pass
             
@@ -208,52 +194,44 @@ class AmazonScraper(BaseScraper):
                 "image_url": "",
             }
             
-            # タイトルを取得
-            title_selectors = [
-                "#productTitle",
-                "h1.a-size-large",
-                "h1",
-            ]
-            for selector in title_selectors:
-                try:
-                    title_elem = page.locator(selector).first
-                    if title_elem.count() > 0:
-                        item_info["title"] = title_elem.inner_text().strip()
-                        print(f"タイトル取得: {item_info['title'][:50]}")
-                        break
-                except:
-                    continue
-            
-            # 価格を取得
-            price_selectors = [
-                ".a-price-whole",
-                "#priceblock_ourprice",
-                "#priceblock_dealprice",
-                ".a-price .a-offscreen",
-                "span.a-price",
-            ]
-            for selector in price_selectors:
-                try:
-                    price_elem = page.locator(selector).first
-                    if price_elem.count() > 0:
-                        price_text = price_elem.inner_text().strip()
-                        # 価格から数字を抽出
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            item_info["price"] = f"¥{price_match.group()}"
-                            print(f"価格取得: {item_info['price']}")
-                            break
-                except:
-                    continue
-            
-            # 画像URLを取得
+            # タイトル・価格・画像URLを1回のJS評価でまとめて取得
+            # （セレクタごとのlocator/count/inner_text往復をなくす）
             try:
-                img_elem = page.locator("#landingImage, #imgBlkFront").first
-                if img_elem.count() > 0:
-                    item_info["image_url"] = img_elem.get_attribute("src") or ""
-            except:
-                pass
-            
+                data = page.evaluate(
+                    """(sels) => {
+                        const get = (list) => list.map((s) => document.querySelector(s)).find(Boolean);
+                        const title = get(sels.title);
+                        const price = get(sels.price);
+                        const img = get(sels.image);
+                        return {
+                            title: title ? title.innerText.trim() : '',
+                            price: price ? price.innerText.trim() : '',
+                            image_url: img ? (img.getAttribute('src') || '') : '',
+                        };
+                    }""",
+                    {
+                        "title": list(self._TITLE_SELECTORS),
+                        "price": list(self._PRICE_SELECTORS),
+                        "image": list(self._IMAGE_SELECTORS),
+                    }
+                )
+            except Exception as e:
+                print(f"  商品情報の抽出でエラー: {e}")
+                data = {"title": "", "price": "", "image_url": ""}
+
+            if data.get("title"):
+                item_info["title"] = data["title"]
+                print(f"タイトル取得: {item_info['title'][:50]}")
+
+            if data.get("price"):
+                # 価格から数字を抽出
+                price_match = _PRICE_RE.search(data["price"].replace(',', ''))
+                if price_match:
+                    item_info["price"] = f"¥{price_match.group()}"
+                    print(f"価格取得: {item_info['price']}")
+
+            item_info["image_url"] = data.get("image_url", "")
+
             return item_info
         
         except Exception as e:
@@ -262,4 +240,4 @@ class AmazonScraper(BaseScraper):
             traceback.print_exc()
             return None
         finally:
-            page.context.close()
+            self.release_page(page)
@@ -11,38 +11,52 @@ python3 analyze_jobs.py
 """
 
 import csv
+from itertools import chain
 from pathlib import Path
 from collections import Counter
+from typing import Iterator
 import re
 
+import numpy as np
 
-def read_csv(file_path: str) -> list:
+# タイトル分析で数えるキーワード
+# 1本の連結パターンにすることで、キーワード数に関係なくテキストを1回走査するだけで済む
+TITLE_KEYWORDS = ['制作', '開発', '作成', 'リサーチ', 'デザイン', '運用', '分析']
+_KEYWORD_RE = re.compile('|'.join(map(re.escape, TITLE_KEYWORDS)))
+
+# 応募者数などの数値抽出用
+_DIGITS_RE = re.compile(r'(\d+)')
+
+
+def read_csv(file_path: str) -> Iterator[dict]:
     """
-    CSVファイルを読み込む
-    
+    CSVファイルを読み込み、行を1件ずつyieldする
+
+    ファイル全体をリストとして保持しないため、大きなCSVでも
+    メモリ使用量は1行分で済みます。
+
     Input:
         file_path: CSVファイルのパス
-    
+
     Output:
-        list: 案件データのリスト
+        Iterator[dict]: 案件データのイテレーター
     """
-    jobs = []
     csv_path = Path(file_path)
-    
+
     if not csv_path.exists():
         print(f"エラー: {file_path} が見つかりません。")
-        return jobs
-    
+        return
+
     try:
         with open(csv_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
+            count = 0
             for row in reader:
-                jobs.append(row)
-        print(f"✓ {len(jobs)}件のデータを読み込みました。")
+                count += 1
+                yield row
+        print(f"✓ {count}件のデータを読み込みました。")
     except Exception as e:
         print(f"エラー: CSVファイルの読み込みに失敗しました: {e}")
-    
-    return jobs
 
 
 def extract_price_number(price_str: str) -> float:
@@ -68,94 +82,98 @@ def extract_price_number(price_str: str) -> float:
     return 0.0
 
 
-def analyze_jobs(jobs: list):
+def analyze_jobs(jobs):
     """
     案件データを分析
-    
+
+    1回の走査でカテゴリー・価格・応募者数・キーワードの全集計を同時に
+    更新するため、リストだけでなくジェネレーターもそのまま渡せます。
+
     Input:
-        jobs: 案件データのリスト
+        jobs: 案件データのイテラブル
     """
-    if not jobs:
+    total_jobs = 0
+    category_counts = Counter()
+    price_values = []
+    applicants_list = []
+    keyword_counts = Counter()
+
+    # 1回の走査で全集計を更新（複数パスでリストを保持しない）
+    for job in jobs:
+        total_jobs += 1
+
+        category = job.get('category')
+        if category:
+            category_counts[category] += 1
+
+        price = extract_price_number(job.get('price', ''))
+        if price > 0:
+            price_values.append(price)
+
+        applicants_str = job.get('applicants', '')
+        if applicants_str:
+            match = _DIGITS_RE.search(applicants_str)
+            if match:
+                applicants_list.append(int(match.group(1)))
+
+        title = job.get('title', '')
+        if title:
+            keyword_counts.update(_KEYWORD_RE.findall(title))
+
+    if total_jobs == 0:
         print("分析するデータがありません。")
         return
-    
+
     print("\n" + "=" * 60)
     print("データ分析結果")
     print("=" * 60)
-    
+
     # 基本統計
     print("\n【基本統計】")
-    print(f"総案件数: {len(jobs)}件")
-    
+    print(f"総案件数: {total_jobs}件")
+
     # カテゴリー別集計
-    categories = [job.get('category', '不明') for job in jobs if job.get('category')]
-    if categories:
+    if category_counts:
         print("\n【カテゴリー別案件数】")
-        category_counts = Counter(categories)
         for category, count in category_counts.most_common():
             print(f"  {category}: {count}件")
-    
-    # 価格分析
-    prices = [extract_price_number(job.get('price', '')) for job in jobs]
-    prices = [p for p in prices if p > 0]
-    
-    if prices:
+
+    # 価格分析（NumPyで一括集計）
+    prices = np.asarray(price_values, dtype=np.float64)
+
+    if prices.size:
         print("\n【価格分析】")
-        print(f"  平均価格: {sum(prices)/len(prices):,.0f}円")
-        print(f"  最高価格: {max(prices):,.0f}円")
-        print(f"  最低価格: {min(prices):,.0f}円")
-        
-        # 価格帯別集計
-        price_ranges = {
-            "5,000円未満": 0,
-            "5,000円〜10,000円": 0,
-            "10,000円〜50,000円": 0,
-            "50,000円以上": 0
-        }
-        
-        for price in prices:
-            if price < 5000:
-                price_ranges["5,000円未満"] += 1
-            elif price < 10000:
-                price_ranges["5,000円〜10,000円"] += 1
-            elif price < 50000:
-                price_ranges["10,000円〜50,000円"] += 1
-            else:
-                price_ranges["50,000円以上"] += 1
-        
+        print(f"  平均価格: {prices.mean():,.0f}円")
+        print(f"  最高価格: {prices.max():,.0f}円")
+        print(f"  最低価格: {prices.min():,.0f}円")
+
+        # 価格帯別集計（ヒストグラムで一括カウント）
+        range_labels = [
+            "5,000円未満",
+            "5,000円〜10,000円",
+            "10,000円〜50,000円",
+            "50,000円以上"
+        ]
+        counts, _ = np.histogram(prices, bins=[0, 5000, 10000, 50000, np.inf])
+
         print("\n【価格帯別案件数】")
-        for range_name, count in price_ranges.items():
+        for range_name, count in zip(range_labels, counts):
             if count > 0:
                 print(f"  {range_name}: {count}件")
-    
+
     # 応募者数分析
-    applicants_list = []
-    for job in jobs:
-        applicants_str = job.get('applicants', '')
-        if applicants_str:
-            match = re.search(r'(\d+)', applicants_str)
-            if match:
-                applicants_list.append(int(match.group(1)))
-    
-    if applicants_list:
+    applicants = np.asarray(applicants_list, dtype=np.int64)
+
+    if applicants.size:
         print("\n【応募者数分析】")
-        print(f"  平均応募者数: {sum(applicants_list)/len(applicants_list):.1f}人")
-        print(f"  最多応募者数: {max(applicants_list)}人")
-        print(f"  最少応募者数: {min(applicants_list)}人")
-    
+        print(f"  平均応募者数: {applicants.mean():.1f}人")
+        print(f"  最多応募者数: {applicants.max()}人")
+        print(f"  最少応募者数: {applicants.min()}人")
+
     # タイトル分析（キーワード抽出）
     print("\n【よく使われるキーワード】")
-    all_titles = ' '.join([job.get('title', '') for job in jobs])
-    # 簡単なキーワード抽出（実際にはもっと高度な分析が可能）
-    keywords = ['制作', '開発', '作成', 'リサーチ', 'デザイン', '運用', '分析']
-    keyword_counts = {}
-    for keyword in keywords:
-        count = all_titles.count(keyword)
-        if count > 0:
-            keyword_counts[keyword] = count
-    
     if keyword_counts:
-        for keyword, count in sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True):
+        for keyword, count in keyword_counts.most_common():
             print(f"  {keyword}: {count}回")
     
     print("\n" + "=" * 60)
@@ -188,18 +206,12 @@ def main():
             print(f"  - {f}")
         return
     
-    # すべてのCSVファイルを読み込んで結合
-    all_jobs = []
+    # すべてのCSVファイルをストリームとして連結して分析
+    # （全行をリストに溜め込まず、読み込みながら1回の走査で集計する）
     for csv_file in found_files:
-        print(f"\n読み込み中: {csv_file}")
-        jobs = read_csv(csv_file)
-        all_jobs.extend(jobs)
-    
-    # 分析実行
-    if all_jobs:
-        analyze_jobs(all_jobs)
-    else:
-        print("\n分析するデータがありません。")
+        print(f"\n読み込み対象: {csv_file}")
+
+    analyze_jobs(chain.from_iterable(read_csv(f) for f in found_files))
 
 
 if __name__ == "__main__":
@@ -5,20 +5,41 @@
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 import sys
 import os
 from pathlib import Path
-import time
 
 # 親ディレクトリのパスを追加
 sys.path.insert(0, str(Path(__file__).parent))
 
 from mercari.scraper import MercariScraper
 
+
+class OrJSONProvider(JSONProvider):
+    """
+    orjsonを使う高速なJSONプロバイダ
+
+    標準のjsonモジュールより数倍速く、日本語を\\uXXXXにエスケープせず
+    UTF-8のまま出力するためレスポンスも小さくなります。
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
 CORS(app)  # クロスオリジンリクエストを許可（スプレッドシートから呼び出すため）
 
+# 詳細ページ取得の同時実行数（待ち時間の大半はページ読み込みのI/O待ち）
+MAX_CONCURRENCY = 5
+
 
 @app.route('/api/scrape', methods=['POST'])
 def scrape_mercari():
@@ -56,32 +77,28 @@ def scrape_mercari():
             os.environ['PLAYWRIGHT_BROWSERS_PATH'] = os.path.expanduser('~/playwright-browsers')
         
         items_data = []
-        
+
         with MercariScraper(headless=True) as scraper:
             target_url = f"https://www.mercari.com/jp/search/?keyword={keyword}"
             item_links = scraper.scrape_list(target_url)
-            
+
             if not item_links:
                 return jsonify({
                     "success": False,
                     "error": "商品リンクが見つかりませんでした。"
                 }), 404
-            
-            # 商品情報を取得
-            for i, item_url in enumerate(item_links[:max_items * 2]):  # 余裕を持って取得
-                if len(items_data) >= max_items:
-                    break
-                
-                try:
-                    item_info = scraper.scrape_detail(item_url)
-                    if item_info:
-                        title = item_info.get('title', '')
-                        if title and len(title) > 5:
-                            items_data.append(item_info)
-                except Exception as e:
-                    continue
-                
-                time.sleep(1)  # リクエスト間隔
+
+            # 商品情報を並列取得（I/O待ちが支配的なため、逐次実行より大幅に速い）
+            target_links = item_links[:max_items * 2]  # 余裕を持って取得
+            results = scraper.scrape_details_batch(target_links, max_workers=MAX_CONCURRENCY)
+
+        for item_info in results:
+            if item_info:
+                title = item_info.get('title', '')
+                if title and len(title) > 5:
+                    items_data.append(item_info)
+
+        items_data = items_data[:max_items]
         
         return jsonify({
             "success": True,
@@ -113,6 +130,11 @@ if __name__ == '__main__':
     print("ヘルスチェック: http://localhost:5000/api/health")
     print()
     print("スプレッドシートから呼び出す場合は、このサーバーを起動したままにしてください。")
+    print()
+    print("本番運用ではgunicornでの起動を推奨します:")
+    print("  gunicorn -w 2 --threads 8 -b 0.0.0.0:5000 api_server:app")
     print("=" * 60)
-    
-    app.run(host='0.0.0.0', port=5000, debug=True)
+
+    # debug=Trueのリローダーは単一スレッドで処理するためリクエストが直列化する。
+    # ローカル実行でもthreaded=Trueで同時リクエストを受け付ける。
+    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
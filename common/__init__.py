@@ -4,7 +4,21 @@
 各サイトのスクレイパーで使用する共通機能を提供します。
 """
 
-from .base_scraper import BaseScraper
-from .utils import save_to_csv, extract_price_number
+from .base_scraper import BaseScraper, get_shared_browser
+from .cache import UrlCache, fetch_details_with_cache
+from .http import get_session
+from .price import extract_price
+from .utils import save_to_csv, extract_price_number, RateLimiter, CsvSink
 
-__all__ = ['BaseScraper', 'save_to_csv', 'extract_price_number']
+__all__ = [
+    'BaseScraper',
+    'get_shared_browser',
+    'UrlCache',
+    'fetch_details_with_cache',
+    'get_session',
+    'extract_price',
+    'save_to_csv',
+    'extract_price_number',
+    'RateLimiter',
+    'CsvSink',
+]
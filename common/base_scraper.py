@@ -5,8 +5,225 @@
 """
 
 from playwright.sync_api import sync_playwright, Page, Browser
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterator
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import queue
+import threading
+
+# プロセス内で共有するブラウザのキャッシュ
+# PlaywrightのSync APIは生成したスレッドに束縛されるため、スレッドごとに管理します。
+_thread_cache = threading.local()
+_shared_lock = threading.Lock()
+_all_browsers: List[Browser] = []
+
+_BROWSER_TYPES = ("chromium", "firefox", "webkit")
+
+# Chromiumの起動フラグ。自動化検知の無効化に加えて、バックグラウンド
+# スロットリング・翻訳UI・サイト分離（オリジンごとのレンダラプロセス）を
+# 止めることで、コンテキストあたりのCPU・メモリ消費を抑える
+_CHROMIUM_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-features=Translate,IsolateOrigins,site-per-process,BackForwardCache",
+    "--disable-dev-shm-usage",
+]
+
+
+def get_shared_browser(browser_type: str = "chromium", headless: bool = False) -> Browser:
+    """
+    共有ブラウザを取得（初回のみ起動し、以降は再利用）
+
+    ブラウザの起動には1〜2秒かかるため、呼び出しごとに起動せず
+    プロセス内でキャッシュして使い回します。
+
+    Input:
+        browser_type: ブラウザタイプ ("chromium", "firefox", "webkit")
+        headless: ヘッドレスモードで実行するか
+
+    Output:
+        Browser: PlaywrightのBrowserオブジェクト
+    """
+    if browser_type not in _BROWSER_TYPES:
+        raise ValueError(f"Unknown browser type: {browser_type}")
+
+    browsers = getattr(_thread_cache, "browsers", None)
+    if browsers is None:
+        browsers = _thread_cache.browsers = {}
+
+    key = (browser_type, headless)
+    browser = browsers.get(key)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    playwright = getattr(_thread_cache, "playwright", None)
+    if playwright is None:
+        playwright = _thread_cache.playwright = sync_playwright().start()
+
+    launch_options: Dict[str, Any] = {"headless": headless}
+    if browser_type == "chromium":
+        launch_options["args"] = _CHROMIUM_LAUNCH_ARGS
+    browser = getattr(playwright, browser_type).launch(**launch_options)
+    browsers[key] = browser
+    with _shared_lock:
+        _all_browsers.append(browser)
+    return browser
+
+
+def _close_shared_browsers():
+    """プロセス終了時に共有ブラウザをまとめてクローズ"""
+    with _shared_lock:
+        for browser in _all_browsers:
+            try:
+                browser.close()
+            except Exception:
+                pass
+        _all_browsers.clear()
+
+
+atexit.register(_close_shared_browsers)
+
+# 詳細取得用の共有ワーカープール。呼び出しごとにThreadPoolExecutorを
+# 作り直すと毎回新しいスレッドが立ち、そのスレッドローカルのブラウザは
+# atexitまで閉じられずに溜まり続ける（api_serverのような常駐プロセスでは
+# リクエストのたびにブラウザがリークする）。プロセス内で1つのプールを
+# 使い回すことで、スレッドとそのブラウザが呼び出しをまたいで再利用される
+_DETAIL_POOL_WORKERS = 8
+_detail_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_detail_executor() -> ThreadPoolExecutor:
+    """詳細取得用の共有エグゼキュータを取得（初回のみ生成）"""
+    global _detail_executor
+    with _shared_lock:
+        if _detail_executor is None:
+            _detail_executor = ThreadPoolExecutor(
+                max_workers=_DETAIL_POOL_WORKERS,
+                thread_name_prefix="detail-worker",
+            )
+        return _detail_executor
+
+
+def _close_thread_browsers() -> None:
+    """
+    このスレッドの共有ブラウザとPlaywrightを終了
+
+    共有エグゼキュータのスレッドはプロセス中ずっと生きるためブラウザを
+    持ち続けてよいが、呼び出しごとに使い捨てるスレッドが共有ブラウザを
+    起動した場合は、スレッド終了前にここで後始末する。
+    """
+    browsers = getattr(_thread_cache, "browsers", None)
+    if browsers:
+        for browser in browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+            with _shared_lock:
+                if browser in _all_browsers:
+                    _all_browsers.remove(browser)
+        browsers.clear()
+    playwright = getattr(_thread_cache, "playwright", None)
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception:
+            pass
+        _thread_cache.playwright = None
+
+# ブロックする重いリソースタイプ（DOMテキストの抽出には不要）
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# ブロックする既知のトラッカー・広告ホスト
+BLOCKED_HOSTS = (
+    "amazon-adsystem.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "doubleclick.net",
+    "facebook.net",
+)
+
+
+def _route_heavy_resources(route):
+    """画像・フォント・メディア・トラッカーへのリクエストを中断するルートハンドラ"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+        return
+    if any(host in request.url for host in BLOCKED_HOSTS):
+        route.abort()
+        return
+    route.continue_()
+
+
+class ContextPool:
+    """
+    BrowserContextのプール
+
+    コンテキストの生成はCookieジャーやネットワークスタックの割り当てを伴うため、
+    毎回作り直さず、使い終わったコンテキストをクリアして再利用します。
+    メモリの肥大を防ぐため、一定回数使ったコンテキストは破棄して作り直します。
+    """
+
+    def __init__(self, browser: Browser, context_options: Dict[str, Any], max_uses: int = 20):
+        """
+        初期化
+
+        Input:
+            browser: コンテキストの生成元となるBrowser
+            context_options: new_contextに渡すオプション
+            max_uses: コンテキストを作り直すまでの使用回数
+        """
+        self.browser = browser
+        self.context_options = context_options
+        self.max_uses = max_uses
+        self._idle: List[Any] = []  # [(context, uses), ...]
+        self._uses: Dict[Any, int] = {}
+
+    def acquire(self):
+        """プールからコンテキストを取得（空なら新規作成）"""
+        if self._idle:
+            context, uses = self._idle.pop()
+            self._uses[context] = uses
+            return context
+        context = self.browser.new_context(**self.context_options)
+        self._uses[context] = 0
+        return context
+
+    def release(self, context) -> None:
+        """使い終わったコンテキストをクリアしてプールへ返却"""
+        uses = self._uses.pop(context, 0) + 1
+        if uses >= self.max_uses:
+            self._safe_close(context)
+            return
+        try:
+            for page in context.pages:
+                page.close()
+            context.clear_cookies()
+        except Exception:
+            self._safe_close(context)
+            return
+        self._idle.append((context, uses))
+
+    def owns(self, context) -> bool:
+        """このプールから貸し出したコンテキストかどうか"""
+        return context in self._uses
+
+    def close(self) -> None:
+        """プール内のコンテキストをすべてクローズ"""
+        while self._idle:
+            context, _ = self._idle.pop()
+            self._safe_close(context)
+
+    @staticmethod
+    def _safe_close(context) -> None:
+        try:
+            context.close()
+        except Exception:
+            pass
 
 
 class BaseScraper(ABC):
@@ -26,37 +243,37 @@ class BaseScraper(ABC):
         """
         self.headless = headless
         self.browser_type = browser_type
-        self.playwright = None
         self.browser: Optional[Browser] = None
+        self._context_pool: Optional[ContextPool] = None
 
     def __enter__(self):
-        """コンテキストマネージャー開始"""
-        self.playwright = sync_playwright().start()
-
-        if self.browser_type == "chromium":
-            self.browser = self.playwright.chromium.launch(headless=self.headless)
-        elif self.browser_type == "firefox":
-            self.browser = self.playwright.firefox.launch(headless=self.headless)
-        elif self.browser_type == "webkit":
-            self.browser = self.playwright.webkit.launch(headless=self.headless)
-        else:
-            raise ValueError(f"Unknown browser type: {self.browser_type}")
-
+        """コンテキストマネージャー開始（共有ブラウザを再利用）"""
+        self.browser = get_shared_browser(self.browser_type, self.headless)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """コンテキストマネージャー終了"""
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+        """
+        コンテキストマネージャー終了
+
+        ブラウザは共有のためここでは閉じません（プロセス終了時にatexitでクローズ）。
+        """
+        if self._context_pool is not None:
+            self._context_pool.close()
+            self._context_pool = None
+        self.browser = None
 
-    def get_page(self, viewport_size: Optional[Dict[str, int]] = None) -> Page:
+    def get_page(
+        self,
+        viewport_size: Optional[Dict[str, int]] = None,
+        block_resources: bool = False
+    ) -> Page:
         """
         新しいページを作成
 
         Input:
             viewport_size: ビューポートサイズ {"width": 1280, "height": 720}
+            block_resources: 画像・フォント・メディア等の重いリソースをブロックするか
+                （DOMテキストのみ読むスクレイパーでは転送量と読み込み時間を大幅に削減）
 
         Output:
             Page: PlaywrightのPageオブジェクト
@@ -64,16 +281,192 @@ class BaseScraper(ABC):
         if not self.browser:
             raise RuntimeError("Browser not initialized. Use context manager (with statement)")
 
-        context = self.browser.new_context(
-            viewport=viewport_size or {"width": 1280, "height": 720},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        context_options = {
+            "viewport": viewport_size or {"width": 1280, "height": 720},
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             # Google翻訳を無効にする
-            locale="ja-JP",
-            timezone_id="Asia/Tokyo",
+            "locale": "ja-JP",
+            "timezone_id": "Asia/Tokyo",
             # 拡張機能を無効にする（翻訳拡張機能を避けるため）
-            ignore_https_errors=True
+            "ignore_https_errors": True,
+        }
+
+        # カスタムビューポート指定時はプールを使わず単発のコンテキストを作成
+        if viewport_size is not None:
+            context = self.browser.new_context(**context_options)
+        else:
+            if self._context_pool is None or self._context_pool.browser is not self.browser:
+                self._context_pool = ContextPool(self.browser, context_options)
+            context = self._context_pool.acquire()
+
+        page = context.new_page()
+        if block_resources:
+            page.route("**/*", _route_heavy_resources)
+        return page
+
+    def release_page(self, page: Page) -> None:
+        """
+        使い終わったページを返却
+
+        プールから貸し出したコンテキストはクリアして再利用し、
+        それ以外はそのままクローズします。
+
+        Input:
+            page: get_pageで取得したPageオブジェクト
+        """
+        context = page.context
+        try:
+            page.close()
+        except Exception:
+            pass
+        if self._context_pool is not None and self._context_pool.owns(context):
+            self._context_pool.release(context)
+        else:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def scrape_details_batch(
+        self,
+        urls: List[str],
+        max_workers: int = 5,
+        **kwargs
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        複数の詳細ページを並列で取得
+
+        待ち時間の大半はページ読み込みのI/O待ちのため、並列化により
+        所要時間はおよそ N×T から ceil(N/ワーカー数)×T に短縮されます。
+        PlaywrightのSync APIオブジェクトは生成スレッドに束縛されるため、
+        ワーカースレッドごとに同じクラスのスクレイパーを起動します。
+        スレッドはプロセス内の共有エグゼキュータから取るため、スレッド
+        ローカルのブラウザは呼び出しをまたいで再利用され、2回目以降の
+        バッチでは起動コストがかかりません。
+
+        Input:
+            urls: 詳細ページのURLリスト
+            max_workers: 同時実行数
+            **kwargs: scrape_detailに渡す追加の引数
+
+        Output:
+            List[Optional[Dict[str, Any]]]: urlsと同じ順序の取得結果（失敗はNone）
+        """
+        if not urls:
+            return []
+
+        # 共有エグゼキュータのスレッド数とは別に、この呼び出しの
+        # 同時実行数はセマフォでmax_workersに制限する
+        semaphore = threading.Semaphore(max_workers)
+
+        def worker(url: str) -> Optional[Dict[str, Any]]:
+            with semaphore:
+                try:
+                    with type(self)(headless=self.headless, browser_type=self.browser_type) as scraper:
+                        return scraper.scrape_detail(url, **kwargs)
+                except Exception as e:
+                    print(f"  詳細取得エラー: {e}")
+                    return None
+
+        return list(_get_detail_executor().map(worker, urls))
+
+    def scrape_list_stream(self, url: str, **kwargs) -> Iterator[str]:
+        """
+        一覧ページから商品リンクを見つけた順に返すジェネレータ
+
+        既定ではscrape_listに委譲します。ページネーションしながら
+        逐次リンクを発見できるサイトはオーバーライドしてください。
+
+        Input:
+            url: 一覧ページのURL
+            **kwargs: scrape_listに渡す追加の引数
+
+        Output:
+            Iterator[str]: アイテム詳細ページのURL
+        """
+        for item_url in self.scrape_list(url, **kwargs):
+            yield item_url
+
+    def scrape_pipeline(
+        self,
+        list_url: str,
+        max_workers: int = 5,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        リスト取得と詳細取得をパイプライン実行し、完了順に商品情報を返す
+
+        プロデューサスレッドがscrape_list_streamのURLを有限キューに流し、
+        ワーカースレッドが（スレッドごとのスクレイパーで）詳細を取得します。
+        詳細取得がリスト取得の完了を待たずに始まるため、リスト取得の
+        所要時間がほぼまるごとクリティカルパスから消えます。キューの
+        maxsizeがそのままバックプレッシャになります。
+
+        Input:
+            list_url: 一覧ページのURL
+            max_workers: 詳細取得の同時実行数
+            limit: 処理するURLの最大件数（Noneで無制限）
+            **kwargs: scrape_detailに渡す追加の引数
+
+        Output:
+            Iterator[Optional[Dict[str, Any]]]: 商品情報（失敗はNone）
+        """
+        url_queue: "queue.Queue" = queue.Queue(maxsize=32)
+        result_queue: "queue.Queue" = queue.Queue()
+        _worker_done = object()  # ワーカー終了の番兵
+
+        def producer() -> None:
+            count = 0
+            try:
+                with type(self)(headless=self.headless, browser_type=self.browser_type) as scraper:
+                    for item_url in scraper.scrape_list_stream(list_url):
+                        url_queue.put(item_url)
+                        count += 1
+                        if limit is not None and count >= limit:
+                            break
+            except Exception as e:
+                print(f"  リスト取得エラー: {e}")
+            finally:
+                for _ in range(max_workers):
+                    url_queue.put(None)
+                # このスレッドは使い捨てのため、起動したブラウザをここで閉じる
+                _close_thread_browsers()
+
+        def worker() -> None:
+            try:
+                with type(self)(headless=self.headless, browser_type=self.browser_type) as scraper:
+                    while True:
+                        item_url = url_queue.get()
+                        if item_url is None:
+                            break
+                        try:
+                            result_queue.put(scraper.scrape_detail(item_url, **kwargs))
+                        except Exception as e:
+                            print(f"  詳細取得エラー ({item_url}): {e}")
+                            result_queue.put(None)
+            finally:
+                result_queue.put(_worker_done)
+                # このスレッドは使い捨てのため、起動したブラウザをここで閉じる
+                _close_thread_browsers()
+
+        threads = [threading.Thread(target=producer, daemon=True)]
+        threads.extend(
+            threading.Thread(target=worker, daemon=True) for _ in range(max_workers)
         )
-        return context.new_page()
+        for thread in threads:
+            thread.start()
+
+        finished_workers = 0
+        while finished_workers < max_workers:
+            result = result_queue.get()
+            if result is _worker_done:
+                finished_workers += 1
+            else:
+                yield result
+
+        for thread in threads:
+            thread.join()
 
     @abstractmethod
     def scrape_list(self, url: str, **kwargs) -> List[str]:
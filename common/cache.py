@@ -0,0 +1,149 @@
+"""
+スクレイピング結果のディスクキャッシュ
+
+商品詳細ページの取得結果をURLをキーにSQLiteへ保存します。
+比較ロジックの調整などで同じURLを何度もスクレイピングし直す際、
+ブラウザ＋ネットワークのコストをディスク参照1回に置き換えられ、
+対象サイトへのアクセス頻度も下がります。
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# キャッシュの有効期間（秒）
+DEFAULT_TTL = 86400.0  # 24時間
+
+# キャッシュファイルの既定の置き場所（リポジトリ直下の.cache/）
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "detail_cache.sqlite3"
+
+
+class UrlCache:
+    """
+    URLをキーにした商品詳細のSQLiteキャッシュ
+
+    Input:
+        path: SQLiteファイルのパス（省略時はDEFAULT_CACHE_PATH）
+        ttl: キャッシュの有効期間（秒、デフォルト24時間）
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        path_obj = Path(path) if path else DEFAULT_CACHE_PATH
+        path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+        # 複数スレッドからの読み書きはロックで直列化する
+        self._db = sqlite3.connect(str(path_obj), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS detail(url TEXT PRIMARY KEY, ts REAL, json TEXT)"
+        )
+        self._db.commit()
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュから商品情報を取得
+
+        Input:
+            url: 商品詳細ページのURL
+
+        Output:
+            Optional[Dict[str, Any]]: 商品情報（未保存・期限切れの場合はNone）
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ts, json FROM detail WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        ts, payload = row
+        if time.time() - ts > self._ttl:
+            return None
+
+        try:
+            return json.loads(payload)
+        except (ValueError, TypeError):
+            return None
+
+    def set(self, url: str, info: Dict[str, Any]) -> None:
+        """
+        商品情報をキャッシュに保存
+
+        Input:
+            url: 商品詳細ページのURL
+            info: 商品情報の辞書
+        """
+        payload = json.dumps(info, ensure_ascii=False)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO detail(url, ts, json) VALUES(?, ?, ?)",
+                (url, time.time(), payload),
+            )
+            self._db.commit()
+
+    def invalidate(self, url: str) -> None:
+        """
+        指定URLのキャッシュを削除（次回アクセス時に再取得させる）
+
+        Input:
+            url: 商品詳細ページのURL
+        """
+        with self._lock:
+            self._db.execute("DELETE FROM detail WHERE url = ?", (url,))
+            self._db.commit()
+
+    def close(self) -> None:
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._db.close()
+
+
+def fetch_details_with_cache(
+    scraper,
+    urls: List[str],
+    cache: Optional[UrlCache],
+    max_workers: int = 3,
+    **kwargs
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    キャッシュ済みURLを除いて商品詳細を並列取得し、新規分を保存
+
+    Input:
+        scraper: scrape_details_batchを持つスクレイパー
+        urls: 商品詳細ページのURLリスト
+        cache: UrlCache（Noneの場合はキャッシュを使わず全件取得）
+        max_workers: 並列取得の同時実行数
+        **kwargs: scrape_details_batchへの追加引数
+
+    Output:
+        List[Optional[Dict[str, Any]]]: urlsと同じ順序の商品情報リスト
+        （取得失敗はNone）
+    """
+    if cache is None:
+        return scraper.scrape_details_batch(urls, max_workers=max_workers, **kwargs)
+
+    results = {}
+    to_fetch = []
+    for url in urls:
+        cached = cache.get(url)
+        if cached is not None:
+            results[url] = cached
+        else:
+            to_fetch.append(url)
+
+    if len(urls) > len(to_fetch):
+        print(f"キャッシュから {len(urls) - len(to_fetch)} 件を取得しました。")
+
+    if to_fetch:
+        fetched = scraper.scrape_details_batch(to_fetch, max_workers=max_workers, **kwargs)
+        for url, info in zip(to_fetch, fetched):
+            results[url] = info
+            if info:
+                cache.set(url, info)
+
+    return [results[url] for url in urls]
@@ -0,0 +1,58 @@
+"""
+共有HTTPクライアント
+
+Playwrightを介さない単発のHTTPアクセス（画像の取得、robots.txtの確認、
+結果の外部送信など）で毎回コネクションを張り直さないよう、
+プロセス全体で1つのコネクションプールを共有します。
+TCP+TLSハンドシェイクを再利用できるため、同一ホストへの
+2回目以降のリクエストは大幅に速くなります。
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+import httpx
+
+# プロセス全体で共有するHTTPクライアント（最初のリクエストで生成）。
+# インポート時に生成するとHTTP/2スタック（h2）がcommonパッケージの
+# インポート自体の必須依存になってしまうため、初回利用まで遅延する
+_session: Optional[httpx.Client] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> httpx.Client:
+    """
+    共有HTTPクライアントを取得（初回のみ生成し、以降は再利用）
+
+    Output:
+        httpx.Client: プロセス全体で共有するクライアント
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=True,
+                timeout=30.0,
+            )
+            atexit.register(_session.close)
+        return _session
+
+
+def get(url: str, **kwargs) -> httpx.Response:
+    """
+    共有クライアント経由でGETリクエストを送る
+
+    スクリプト側でクライアントを直接触らずに済む薄いラッパー。
+    リダイレクトは既定で追従する。
+
+    Input:
+        url: 取得するURL
+        **kwargs: httpx.Client.getへの追加引数（headers等）
+
+    Output:
+        httpx.Response: レスポンス
+    """
+    kwargs.setdefault("follow_redirects", True)
+    return get_session().get(url, **kwargs)
@@ -0,0 +1,83 @@
+"""
+httpxベースの軽量HTMLフェッチャー
+
+JSレンダリングが不要なサーバーサイドレンダリング済みページを、
+ブラウザを起動せずに共有コネクションプール経由で取得します。
+Amazonの検索結果ページなどはHTMLだけで価格が取れることが多く、
+ブラウザ経由よりリクエストあたり1〜2桁軽く済みます。
+"""
+
+from typing import Optional, Tuple
+
+from lxml import html as lxml_html
+
+from .http import get
+
+# ブラウザ相当のリクエストヘッダ（素のhttpxのUAはボット判定されやすい）
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ja-JP,ja;q=0.9",
+}
+
+
+def fetch_html(url: str, headers: Optional[dict] = None) -> Optional[str]:
+    """
+    URLのHTMLを共有コネクションプール経由で取得
+
+    Input:
+        url: 取得するURL
+        headers: リクエストヘッダ（省略時はDEFAULT_HEADERS）
+
+    Output:
+        Optional[str]: HTML文字列（取得失敗時はNone）
+    """
+    try:
+        resp = get(url, headers=headers or DEFAULT_HEADERS)
+        if resp.status_code != 200:
+            print(f"  HTTP取得に失敗しました: status={resp.status_code}")
+            return None
+        return resp.text
+    except Exception as e:
+        print(f"  HTTP取得でエラー: {e}")
+        return None
+
+
+def parse_amazon_search_price(html_text: str) -> Optional[Tuple[float, Optional[str]]]:
+    """
+    Amazon検索結果のHTMLから最初の価格と商品URLを抽出
+
+    Input:
+        html_text: 検索結果ページのHTML
+
+    Output:
+        Optional[Tuple[float, Optional[str]]]: (価格, 商品URL)。
+        価格ノードが見つからない場合（ボットチャレンジページ等）はNone
+    """
+    try:
+        doc = lxml_html.fromstring(html_text)
+    except Exception:
+        return None
+
+    price_nodes = doc.xpath('//span[contains(@class, "a-price-whole")]')
+    if not price_nodes:
+        return None
+
+    digits = "".join(ch for ch in price_nodes[0].text_content() if ch.isdigit())
+    if not digits:
+        return None
+    price = float(digits)
+
+    # 最初の商品リンクを取得
+    amazon_url = None
+    hrefs = doc.xpath('//a[contains(@href, "/dp/")]/@href')
+    if hrefs:
+        href = hrefs[0]
+        if href.startswith("/"):
+            amazon_url = f"https://www.amazon.co.jp{href.split('?')[0]}"
+        else:
+            amazon_url = href.split("?")[0].split("#")[0]
+
+    return price, amazon_url
@@ -0,0 +1,42 @@
+"""
+価格文字列の解析ユーティリティ
+
+各比較スクリプトに重複していたextract_priceの共有実装です。
+ソートキーや比較ループから大量に呼ばれるため、正規表現と
+記号除去テーブルはモジュールレベルで1回だけ用意しています。
+"""
+
+import re
+from functools import lru_cache
+
+# 先頭の数字列を取り出すパターンと、通貨記号・カンマの除去テーブル
+_PRICE_RE = re.compile(r'\d+')
+_NO_COMMA = str.maketrans('', '', ',¥ ')
+_INF = float('inf')
+
+
+# 同じ価格文字列（"¥400"など）がソートキーや比較で何度も渡されるため、
+# 解析結果をメモ化する。入力は読み取り専用のstrで副作用もない
+@lru_cache(maxsize=1024)
+def extract_price(price_str: str) -> float:
+    """
+    価格文字列から数値を抽出
+
+    Input:
+        price_str: 価格文字列（例: "¥400", "¥1,222"）
+
+    Output:
+        float: 価格の数値（解析できない場合はinf）
+    """
+    if not price_str:
+        return _INF
+
+    # 記号を1回のtranslateで除去してから先頭の数字列を取る
+    price_match = _PRICE_RE.search(price_str.translate(_NO_COMMA))
+    if price_match:
+        try:
+            return float(price_match.group())
+        except:
+            return _INF
+
+    return _INF
@@ -4,15 +4,25 @@
 
 import csv
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+
+# 行ごとに呼ばれるためモジュールレベルでコンパイルしておく
+_PRICE_NUMBER_RE = re.compile(r'([0-9,]+)')
+
+# CSV書き込みを次のスクレイピングと重ねるための書き込み専用スレッド
+_IO_POOL = ThreadPoolExecutor(max_workers=1)
 
 
 def save_to_csv(
     data: List[Dict[str, Any]],
     output_path: str,
-    encoding: str = "utf-8-sig"
-) -> str:
+    encoding: str = "utf-8-sig",
+    async_write: bool = False
+) -> Union[str, Future]:
     """
     データをCSVファイルに保存
 
@@ -20,36 +30,127 @@ def save_to_csv(
         data: データのリスト
         output_path: 出力ファイルパス
         encoding: エンコーディング（デフォルト: utf-8-sig for Excel）
+        async_write: Trueの場合はバックグラウンドスレッドで書き込み、
+            Futureを返す（書き込み完了を待ちたい箇所で .result() を呼ぶ）
 
     Output:
-        str: 保存されたファイルのパス
+        Union[str, Future]: 保存されたファイルのパス（async_write=True時はFuture）
     """
     if not data:
         print("保存するデータがありません。")
         return ""
 
+    if async_write:
+        # 呼び出し側のリストがその後変更されても安全なようにコピーして渡す
+        return _IO_POOL.submit(_write_csv, list(data), output_path, encoding)
+
+    return _write_csv(data, output_path, encoding)
+
+
+def _write_csv(
+    data: List[Dict[str, Any]],
+    output_path: str,
+    encoding: str
+) -> str:
+    """CSV書き込みの実体（save_to_csvから同期・非同期の両方で呼ばれる）"""
     output_path_obj = Path(output_path)
     output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    # すべてのキーを取得
-    all_keys = set()
-    for item in data:
-        all_keys.update(item.keys())
-
-    fieldnames = sorted(list(all_keys))
+    # スクレイパーの出力は通常すべての行が同じキーを持つため、その場合は
+    # 和集合のソートを省略して先頭行のキー順をそのまま使う。全行の確認は
+    # キービューの比較1回ずつで済み、和集合のset構築よりも安価。
+    # （先頭と末尾だけの比較では、途中の行にしかない列を黙って落とす）
+    first_keys = data[0].keys()
+    if all(item.keys() == first_keys for item in data):
+        fieldnames = list(first_keys)
+    else:
+        all_keys = set()
+        for item in data:
+            all_keys.update(item.keys())
+        fieldnames = sorted(all_keys)
 
     with open(output_path, "w", newline="", encoding=encoding) as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        # restval/extrasactionに任せることで、行ごとの辞書の作り直しをせず
+        # C実装のwriterowsで一括書き込みできる
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", extrasaction="ignore")
         writer.writeheader()
-
-        for item in data:
-            row = {key: item.get(key, "") for key in fieldnames}
-            writer.writerow(row)
+        writer.writerows(data)
 
     print(f"CSVファイルを保存しました: {output_path}")
     return str(output_path_obj.absolute())
 
 
+class CsvSink:
+    """
+    1行ずつ追記するCSVライター
+
+    全件をメモリに溜めてから書き出すsave_to_csvと違い、
+    商品を取得するたびに1行ずつ書き込んでフラッシュするため、
+    途中でクラッシュしてもそれまでの結果がファイルに残る。
+    列は最初の行のキーで確定する。
+
+    Input:
+        output_path: 出力ファイルパス
+        encoding: エンコーディング（デフォルト: utf-8-sig for Excel）
+    """
+
+    def __init__(self, output_path: str, encoding: str = "utf-8-sig"):
+        self._path = Path(output_path)
+        self._encoding = encoding
+        self._fh = None
+        self._writer = None
+
+    def write(self, item: Dict[str, Any]) -> None:
+        """1件書き込んで即フラッシュ（初回呼び出しでファイルとヘッダを作る）"""
+        if self._writer is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self._path, "w", newline="", encoding=self._encoding)
+            self._writer = csv.DictWriter(
+                self._fh, fieldnames=list(item.keys()), restval="", extrasaction="ignore"
+            )
+            self._writer.writeheader()
+        self._writer.writerow(item)
+        self._fh.flush()
+
+    def close(self) -> None:
+        """ファイルを閉じる（1件も書いていない場合は何もしない）"""
+        if self._fh is not None:
+            self._fh.close()
+            print(f"CSVファイルを保存しました: {self._path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RateLimiter:
+    """
+    最小リクエスト間隔だけを保証するレートリミッタ
+
+    固定スリープと違い、前回のリクエストからの経過時間を差し引いた
+    残り時間だけ待つため、ページ取得自体に間隔以上かかった場合
+    （よくあるケース）はまったく待たない。ホストごとに1つ作る。
+
+    Input:
+        min_interval: リクエスト間の最小間隔（秒）
+    """
+
+    def __init__(self, min_interval: float):
+        self._min_interval = min_interval
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """前回のwait()から最小間隔が経過するまで待機"""
+        with self._lock:
+            delay = self._min_interval - (time.monotonic() - self._last)
+            if delay > 0:
+                time.sleep(delay)
+            self._last = time.monotonic()
+
+
 def extract_price_number(price_str: str) -> float:
     """
     価格文字列から数値を抽出
@@ -64,7 +165,7 @@ def extract_price_number(price_str: str) -> float:
         return 0.0
 
     # 数字と「万」「円」を抽出
-    match = re.search(r'([0-9,]+)', price_str.replace(',', ''))
+    match = _PRICE_NUMBER_RE.search(price_str.replace(',', ''))
     if match:
         number = float(match.group(1))
         if '万' in price_str:
@@ -2,41 +2,64 @@
 Amazonとメルカリの価格を比較して、Amazonより安いポケモンカードを5つ取得するスクリプト
 """
 
+import logging
 import sys
 from pathlib import Path
-import time
-import re
+from collections import defaultdict
 
-# 親ディレクトリのパスを追加
-sys.path.insert(0, str(Path(__file__).parent))
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 from mercari.scraper import MercariScraper
 from amazon.scraper import AmazonScraper
+from common.cache import UrlCache, fetch_details_with_cache
+from common.price import extract_price
 from common.utils import save_to_csv
 
+# 詳細ページ取得の同時実行数（I/O待ちを重ねるため並列で取得する）
+MAX_PARALLEL_PAGES = 3
 
-def extract_price(price_str: str) -> float:
+# 1イテレーションあたり数行のprintはflushのたびに待ちが入るため、
+# ロガー経由の1行ログにまとめる
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+log = logging.getLogger("compare")
+
+_INF = float('inf')
+
+# int.bit_count()はPython 3.10以降（POPCNT 1命令相当）。3.9ではbin()で数える
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+
+class MatchedItem:
     """
-    価格文字列から数値を抽出
-    
-    Args:
-        price_str: 価格文字列（例: "¥400", "¥1,222"）
-    
-    Returns:
-        float: 価格の数値
+    マッチしたメルカリ商品とAmazon側情報の軽量レコード
+
+    マッチのたびに元のdict全体を複製する代わりに、元のdictへの参照と
+    追加フィールドだけを保持する（__slots__で属性辞書も持たない）。
+    CSV保存・表示用のdictはto_dict()で必要になった時点で作る。
     """
-    if not price_str:
-        return float('inf')
-    
-    # 数字とカンマを抽出
-    price_match = re.search(r'[\d,]+', price_str.replace(',', ''))
-    if price_match:
-        try:
-            return float(price_match.group().replace(',', ''))
-        except:
-            return float('inf')
-    
-    return float('inf')
+
+    __slots__ = ('source', 'amazon_price', 'amazon_url', 'price_diff_num')
+
+    def __init__(self, source: dict, amazon_price: str, amazon_url: str,
+                 price_diff_num: float):
+        self.source = source
+        self.amazon_price = amazon_price
+        self.amazon_url = amazon_url
+        self.price_diff_num = price_diff_num
+
+    def to_dict(self) -> dict:
+        """元の商品情報にAmazon側のフィールドを加えたdictを返す"""
+        item = dict(self.source)
+        item['amazon_price'] = self.amazon_price
+        item['amazon_url'] = self.amazon_url
+        item['price_difference'] = f"¥{int(self.price_diff_num)}"
+        return item
 
 
 def compare_and_select_cheaper_items(mercari_items: list, amazon_items: list, max_items: int = 5) -> list:
@@ -51,53 +74,150 @@ def compare_and_select_cheaper_items(mercari_items: list, amazon_items: list, ma
     Returns:
         list: Amazonより安い商品リスト
     """
+    if not mercari_items or not amazon_items:
+        return []
+
     cheaper_items = []
-    
+
+    # 価格を先に1回だけ数値化してSoA（配列）レイアウトに載せる
+    # （比較・選択はNumPyの一括演算で行い、ペアごとのPythonループをなくす）
+    mercari_prices = np.asarray(
+        [extract_price(item.get('price', '')) for item in mercari_items]
+    )
+    amazon_prices = np.asarray(
+        [extract_price(item.get('price', '')) for item in amazon_items]
+    )
+
+    # タイトルのトークンに語彙内のビット位置を割り当て、各タイトルを
+    # 整数のビットセットに変換する。共有キーワード数の判定がペアごとの
+    # set構築なしに「AND + popcount」で済む。あわせてキーワード →
+    # Amazon商品インデックスの転置インデックスを作り、共通トークンを
+    # 1つも持たない商品を比較対象から外す
+    vocab = {}
+    keyword_index = defaultdict(set)
+    amazon_bits = []
+    for j, amazon_item in enumerate(amazon_items):
+        bits = 0
+        for token in amazon_item.get('title', '').lower().split():
+            index = vocab.setdefault(token, len(vocab))
+            bits |= 1 << index
+            keyword_index[token].add(j)
+        amazon_bits.append(bits)
+
     # タイトルでマッチング（簡易版）
-    for mercari_item in mercari_items:
-        mercari_title = mercari_item.get('title', '').lower()
-        mercari_price = extract_price(mercari_item.get('price', ''))
-        
-        if mercari_price == float('inf'):
-            continue
-        
-        # Amazonの商品とタイトルを比較（キーワードマッチング）
-        best_match = None
-        best_price_diff = float('inf')
-        
-        for amazon_item in amazon_items:
-            amazon_title = amazon_item.get('title', '').lower()
-            amazon_price = extract_price(amazon_item.get('price', ''))
-            
-            if amazon_price == float('inf'):
+    # 共有キーワードが2語以上あるペアだけTrueのマッチ行列を作る
+    match = np.zeros((len(mercari_items), len(amazon_items)), dtype=bool)
+    for i, mercari_item in enumerate(mercari_items):
+        # Amazon側の語彙にあるトークンだけビットを立てれば十分
+        # （語彙外のトークンはどの商品とも共有されない）
+        mercari_bits = 0
+        candidates = set()
+        for token in mercari_item.get('title', '').lower().split():
+            index = vocab.get(token)
+            if index is None:
                 continue
-            
-            # タイトルに共通のキーワードがあるかチェック
-            mercari_keywords = set(mercari_title.split())
-            amazon_keywords = set(amazon_title.split())
-            common_keywords = mercari_keywords & amazon_keywords
-            
-            # 共通キーワードが2つ以上ある場合、マッチとみなす
-            if len(common_keywords) >= 2:
-                price_diff = amazon_price - mercari_price
-                if price_diff > 0 and price_diff < best_price_diff:
-                    best_match = amazon_item
-                    best_price_diff = price_diff
-        
-        # Amazonより安い場合
-        if best_match:
-            amazon_price = extract_price(best_match.get('price', ''))
-            if mercari_price < amazon_price:
-                item = mercari_item.copy()
-                item['amazon_price'] = best_match.get('price', '')
-                item['amazon_url'] = best_match.get('url', '')
-                item['price_difference'] = f"¥{int(amazon_price - mercari_price)}"
-                cheaper_items.append(item)
-    
-    # 価格差でソート（大きい順）
-    cheaper_items.sort(key=lambda x: extract_price(x.get('price_difference', '¥0')), reverse=True)
-    
-    return cheaper_items[:max_items]
+            mercari_bits |= 1 << index
+            candidates.update(keyword_index[token])
+
+        for j in candidates:
+            if _popcount(mercari_bits & amazon_bits[j]) >= 2:
+                match[i, j] = True
+
+    # 価格差行列を一括計算し、「マッチかつAmazonの方が高い」ペア以外を
+    # infで潰してから、メルカリ商品ごとに最小の価格差を選ぶ
+    # （価格が解析できなかった商品は差がinf/nanになり自然に除外される。
+    # inf同士の引き算によるnanは想定内のためRuntimeWarningは抑制する）
+    with np.errstate(invalid="ignore"):
+        diff = amazon_prices[None, :] - mercari_prices[:, None]
+    valid = match & (diff > 0) & np.isfinite(diff)
+    diff_masked = np.where(valid, diff, _INF)
+
+    best_indices = diff_masked.argmin(axis=1)
+    best_diffs = diff_masked[np.arange(len(mercari_items)), best_indices]
+
+    for i in np.flatnonzero(np.isfinite(best_diffs)):
+        best_match = amazon_items[int(best_indices[i])]
+        cheaper_items.append(MatchedItem(
+            source=mercari_items[i],
+            amazon_price=best_match.get('price', ''),
+            amazon_url=best_match.get('url', ''),
+            price_diff_num=float(best_diffs[i]),
+        ))
+
+    # 価格差でソート（大きい順）。数値フィールドをそのままキーにする
+    cheaper_items.sort(key=attrgetter('price_diff_num'), reverse=True)
+
+    # 上位だけをCSV保存・表示用のdictに展開する
+    return [matched.to_dict() for matched in cheaper_items[:max_items]]
+
+
+def scrape_mercari_items(search_keyword: str, cache: UrlCache = None) -> list:
+    """
+    メルカリから商品情報を取得（ワーカースレッドで実行される）
+
+    Args:
+        search_keyword: 検索キーワード
+        cache: 商品詳細のディスクキャッシュ（Noneの場合は毎回取得）
+
+    Returns:
+        list: 商品情報のリスト
+    """
+    mercari_items = []
+    mercari_url = f"https://www.mercari.com/jp/search/?keyword={search_keyword}"
+
+    with MercariScraper(headless=False) as mercari_scraper:
+        item_links = mercari_scraper.scrape_list(mercari_url)
+
+        if item_links:
+            log.info("[メルカリ] %d 件の商品リンクを発見。10件を並列取得します...", len(item_links))
+
+            results = fetch_details_with_cache(
+                mercari_scraper, item_links[:10], cache,
+                max_workers=MAX_PARALLEL_PAGES
+            )
+            for item_info in results:
+                if item_info:
+                    title = item_info.get('title', '')
+                    if title and len(title) > 5:
+                        mercari_items.append(item_info)
+                        log.info("✓ [メルカリ] 取得完了: %s", title[:50])
+
+    return mercari_items
+
+
+def scrape_amazon_items(search_keyword: str, cache: UrlCache = None) -> list:
+    """
+    Amazonから商品情報を取得（ワーカースレッドで実行される）
+
+    Args:
+        search_keyword: 検索キーワード
+        cache: 商品詳細のディスクキャッシュ（Noneの場合は毎回取得）
+
+    Returns:
+        list: 商品情報のリスト
+    """
+    amazon_items = []
+    amazon_url = f"https://www.amazon.co.jp/s?k={search_keyword}"
+
+    with AmazonScraper(headless=False) as amazon_scraper:
+        item_links = amazon_scraper.scrape_list(amazon_url)
+
+        if item_links:
+            log.info("[Amazon] %d 件の商品リンクを発見。10件を並列取得します...", len(item_links))
+
+            results = fetch_details_with_cache(
+                amazon_scraper, item_links[:10], cache,
+                max_workers=MAX_PARALLEL_PAGES
+            )
+            for item_info in results:
+                if item_info:
+                    title = item_info.get('title', '')
+                    price = item_info.get('price', '')
+                    if title and len(title) > 5 and price:
+                        amazon_items.append(item_info)
+                        log.info("✓ [Amazon] 取得完了: %s (%s)", title[:50], price)
+
+    return amazon_items
 
 
 def main():
@@ -105,88 +225,35 @@ def main():
     メイン処理
     """
     search_keyword = "ポケモンカード"
-    
-    print("=" * 60)
-    print("Amazonとメルカリの価格比較スクレイピング")
-    print("=" * 60)
-    print(f"検索キーワード: {search_keyword}")
-    print(f"取得件数: 5件（Amazonより安い商品）")
-    print()
-    
+
+    log.info("Amazonとメルカリの価格比較スクレイピング")
+    log.info("検索キーワード: %s / 取得件数: 5件（Amazonより安い商品）", search_keyword)
+
     mercari_items = []
     amazon_items = []
-    
+
     try:
         # 環境変数を設定
         import os
         if os.path.exists(os.path.expanduser('~/playwright-browsers')):
             os.environ['PLAYWRIGHT_BROWSERS_PATH'] = os.path.expanduser('~/playwright-browsers')
-        
-        # メルカリから商品情報を取得
-        print("=" * 60)
-        print("1. メルカリから商品情報を取得中...")
-        print("=" * 60)
-        mercari_url = f"https://www.mercari.com/jp/search/?keyword={search_keyword}"
-        
-        with MercariScraper(headless=False) as mercari_scraper:
-            item_links = mercari_scraper.scrape_list(mercari_url)
-            
-            if item_links:
-                print(f"\n{len(item_links)} 件の商品リンクを発見しました。")
-                print("10件の商品情報を取得します...\n")
-                
-                for i, item_url in enumerate(item_links[:10]):  # 最大10件
-                    print(f"\n{'='*60}")
-                    print(f"メルカリ商品 {i+1}/10 を取得中...")
-                    print('='*60)
-                    
-                    try:
-                        item_info = mercari_scraper.scrape_detail(item_url)
-                        if item_info:
-                            title = item_info.get('title', '')
-                            if title and len(title) > 5:
-                                mercari_items.append(item_info)
-                                print(f"✓ 取得完了: {title[:50]}")
-                    except Exception as e:
-                        print(f"⚠️  エラー: {e}")
-                    
-                    time.sleep(2)
-        
-        # Amazonから商品情報を取得
-        print("\n" + "=" * 60)
-        print("2. Amazonから商品情報を取得中...")
-        print("=" * 60)
-        amazon_url = f"https://www.amazon.co.jp/s?k={search_keyword}"
-        
-        with AmazonScraper(headless=False) as amazon_scraper:
-            item_links = amazon_scraper.scrape_list(amazon_url)
-            
-            if item_links:
-                print(f"\n{len(item_links)} 件の商品リンクを発見しました。")
-                print("10件の商品情報を取得します...\n")
-                
-                for i, item_url in enumerate(item_links[:10]):  # 最大10件
-                    print(f"\n{'='*60}")
-                    print(f"Amazon商品 {i+1}/10 を取得中...")
-                    print('='*60)
-                    
-                    try:
-                        item_info = amazon_scraper.scrape_detail(item_url)
-                        if item_info:
-                            title = item_info.get('title', '')
-                            price = item_info.get('price', '')
-                            if title and len(title) > 5 and price:
-                                amazon_items.append(item_info)
-                                print(f"✓ 取得完了: {title[:50]} ({price})")
-                    except Exception as e:
-                        print(f"⚠️  エラー: {e}")
-                    
-                    time.sleep(2)
-        
+
+        # 詳細ページのディスクキャッシュ（--no-cacheで毎回取得に戻せる）
+        cache = None if '--no-cache' in sys.argv else UrlCache()
+
+        # メルカリとAmazonは別サイト・別ブラウザで完全に独立しているため、
+        # 2つのワーカースレッドで並行して取得する
+        # （所要時間が「メルカリ + Amazon」から「遅い方だけ」になる）
+        log.info("1. メルカリとAmazonから商品情報を並行取得中...")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mercari_future = executor.submit(scrape_mercari_items, search_keyword, cache)
+            amazon_future = executor.submit(scrape_amazon_items, search_keyword, cache)
+            mercari_items = mercari_future.result()
+            amazon_items = amazon_future.result()
+
         # 価格を比較して、Amazonより安い商品を選ぶ
-        print("\n" + "=" * 60)
-        print("3. 価格を比較中...")
-        print("=" * 60)
+        log.info("2. 価格を比較中...")
         
         cheaper_items = compare_and_select_cheaper_items(mercari_items, amazon_items, max_items=5)
         
@@ -195,24 +262,20 @@ def main():
             output_path = Path(__file__).parent / "mercari" / "output" / "cheaper_items.csv"
             save_to_csv(cheaper_items, str(output_path))
             
-            print("\n" + "=" * 60)
-            print("取得結果")
-            print("=" * 60)
-            print(f"取得件数: {len(cheaper_items)}件")
-            print(f"CSVファイル: {output_path}")
-            print("\nAmazonより安い商品:")
+            log.info("取得件数: %d件 / CSVファイル: %s", len(cheaper_items), output_path)
+            log.info("Amazonより安い商品:")
             for i, item in enumerate(cheaper_items, 1):
                 title = item.get('title', 'タイトル不明')
                 price = item.get('price', '価格不明')
                 amazon_price = item.get('amazon_price', '価格不明')
                 price_diff = item.get('price_difference', '')
-                print(f"  {i}. {title[:50]}...")
-                print(f"     メルカリ: {price} | Amazon: {amazon_price} | 差額: {price_diff}")
+                log.info("  %d. %s... メルカリ: %s | Amazon: %s | 差額: %s",
+                         i, title[:50], price, amazon_price, price_diff)
         else:
-            print("\n⚠️  Amazonより安い商品が見つかりませんでした。")
+            log.info("⚠️  Amazonより安い商品が見つかりませんでした。")
     
     except Exception as e:
-        print(f"エラーが発生しました: {e}")
+        log.error("エラーが発生しました: %s", e)
         import traceback
         traceback.print_exc()
 
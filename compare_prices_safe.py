@@ -6,38 +6,14 @@ Amazonスクレイパーを使用せず、メルカリ内での価格比較を
 
 import sys
 from pathlib import Path
-import time
-import re
-
-# 親ディレクトリのパスを追加
-sys.path.insert(0, str(Path(__file__).parent))
 
 from mercari.scraper import MercariScraper
+from common.cache import UrlCache, fetch_details_with_cache
+from common.price import extract_price
 from common.utils import save_to_csv
 
-
-def extract_price(price_str: str) -> float:
-    """
-    価格文字列から数値を抽出
-    
-    Args:
-        price_str: 価格文字列（例: "¥400", "¥1,222"）
-    
-    Returns:
-        float: 価格の数値
-    """
-    if not price_str:
-        return float('inf')
-    
-    # 数字とカンマを抽出
-    price_match = re.search(r'[\d,]+', price_str.replace(',', ''))
-    if price_match:
-        try:
-            return float(price_match.group().replace(',', ''))
-        except:
-            return float('inf')
-    
-    return float('inf')
+# 詳細ページ取得の同時実行数（I/O待ちを重ねるため並列で取得する）
+MAX_PARALLEL_PAGES = 3
 
 
 def analyze_mercari_prices(items: list, max_items: int = 5) -> list:
@@ -80,7 +56,10 @@ def main():
         import os
         if os.path.exists(os.path.expanduser('~/playwright-browsers')):
             os.environ['PLAYWRIGHT_BROWSERS_PATH'] = os.path.expanduser('~/playwright-browsers')
-        
+
+        # 詳細ページのディスクキャッシュ（--no-cacheで毎回取得に戻せる）
+        cache = None if '--no-cache' in sys.argv else UrlCache()
+
         # メルカリから商品情報を取得
         print("=" * 60)
         print("メルカリから商品情報を取得中...")
@@ -92,25 +71,19 @@ def main():
             
             if item_links:
                 print(f"\n{len(item_links)} 件の商品リンクを発見しました。")
-                print("10件の商品情報を取得します...\n")
+                print("10件の商品情報を並列取得します...\n")
                 
-                for i, item_url in enumerate(item_links[:10]):  # 最大10件
-                    print(f"\n{'='*60}")
-                    print(f"メルカリ商品 {i+1}/10 を取得中...")
-                    print('='*60)
-                    
-                    try:
-                        item_info = mercari_scraper.scrape_detail(item_url)
-                        if item_info:
-                            title = item_info.get('title', '')
-                            price = item_info.get('price', '')
-                            if title and len(title) > 5 and price:
-                                mercari_items.append(item_info)
-                                print(f"✓ 取得完了: {title[:50]} ({price})")
-                    except Exception as e:
-                        print(f"⚠️  エラー: {e}")
-                    
-                    time.sleep(2)
+                results = fetch_details_with_cache(
+                    mercari_scraper, item_links[:10], cache,
+                    max_workers=MAX_PARALLEL_PAGES
+                )
+                for item_info in results:
+                    if item_info:
+                        title = item_info.get('title', '')
+                        price = item_info.get('price', '')
+                        if title and len(title) > 5 and price:
+                            mercari_items.append(item_info)
+                            print(f"✓ 取得完了: {title[:50]} ({price})")
         
         # 価格でソートして、安い順に5件選ぶ
         print("\n" + "=" * 60)
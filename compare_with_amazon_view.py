@@ -5,40 +5,74 @@
 Amazonのページはブラウザで開いて確認するだけ（スクレイピングではなく閲覧）。
 """
 
-import sys
 from pathlib import Path
-import time
-import re
-
-# 親ディレクトリのパスを追加
-sys.path.insert(0, str(Path(__file__).parent))
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import threading
 
 from mercari.scraper import MercariScraper
+from common.price import extract_price
 from common.utils import save_to_csv
+from common.http_fetcher import fetch_html, parse_amazon_search_price
+
+# 詳細ページ取得の同時実行数（I/O待ちを重ねるため並列で取得する）
+MAX_PARALLEL_PAGES = 3
 
+# Amazon価格確認の同時実行数（ワーカー数で同時アクセスを制限し、
+# 商品ごとの固定スリープを置き換える）
+AMAZON_VIEW_WORKERS = 3
 
-def extract_price(price_str: str) -> float:
+
+def build_amazon_search_url(mercari_title: str) -> str:
     """
-    価格文字列から数値を抽出
-    
+    メルカリの商品タイトルからAmazonの検索URLを組み立てる
+
     Args:
-        price_str: 価格文字列（例: "¥400", "¥1,222"）
-    
+        mercari_title: メルカリの商品タイトル
+
     Returns:
-        float: 価格の数値
+        str: Amazonの検索結果ページURL
     """
-    if not price_str:
-        return float('inf')
-    
-    # 数字とカンマを抽出
-    price_match = re.search(r'[\d,]+', price_str.replace(',', ''))
-    if price_match:
-        try:
-            return float(price_match.group().replace(',', ''))
-        except:
-            return float('inf')
-    
-    return float('inf')
+    # 商品タイトルから検索キーワードを抽出（簡易版）
+    # ポケモンカード関連のキーワードを抽出
+    keywords = mercari_title.replace("ポケモンカード", "").strip()
+    if not keywords:
+        keywords = "ポケモンカード"
+
+    return f"https://www.amazon.co.jp/s?k={keywords}"
+
+
+def get_amazon_price_fast(mercari_title: str, mercari_price: float) -> tuple:
+    """
+    httpxでAmazonの検索結果HTMLを直接取得して価格を確認（高速パス）
+
+    Amazonの検索結果はサーバーサイドレンダリングされているため、
+    ほとんどの場合ブラウザを開かずにHTMLだけで価格が取れます。
+
+    Args:
+        mercari_title: メルカリの商品タイトル
+        mercari_price: メルカリの価格
+
+    Returns:
+        tuple: (amazon_price, amazon_url, price_difference)。
+        価格ノードが見つからない場合（ボットチャレンジ等）はNone
+        （呼び出し側でPlaywrightにフォールバックする）
+    """
+    search_url = build_amazon_search_url(mercari_title)
+    print(f"  Amazon検索URL（httpx）: {search_url}")
+
+    html_text = fetch_html(search_url)
+    if html_text is None:
+        return None
+
+    parsed = parse_amazon_search_price(html_text)
+    if parsed is None:
+        print("  HTMLから価格を取得できませんでした。ブラウザにフォールバックします...")
+        return None
+
+    amazon_price, amazon_url = parsed
+    print(f"  Amazon価格を確認: ¥{int(amazon_price)}")
+    return amazon_price, amazon_url, amazon_price - mercari_price
 
 
 def get_amazon_price_by_viewing(page, mercari_title: str, mercari_price: float) -> tuple:
@@ -54,68 +88,42 @@ def get_amazon_price_by_viewing(page, mercari_title: str, mercari_price: float)
         tuple: (amazon_price, amazon_url, price_difference)
     """
     try:
-        # 商品タイトルから検索キーワードを抽出（簡易版）
-        # ポケモンカード関連のキーワードを抽出
-        keywords = mercari_title.replace("ポケモンカード", "").strip()
-        if not keywords:
-            keywords = "ポケモンカード"
-        
         # Amazonの検索結果ページを開く
-        search_url = f"https://www.amazon.co.jp/s?k={keywords}"
+        search_url = build_amazon_search_url(mercari_title)
         print(f"  Amazon検索URL: {search_url}")
         
         page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-        page.wait_for_timeout(3000)  # ページ読み込み待機
-        
-        # クッキー同意ボタンをクリック（存在する場合）
+
+        # 価格ノードが描画された時点で即座に先へ進む
+        # （固定3秒待ちを置き換え。描画が速ければ数百msで返る）
         try:
-            cookie_button = page.locator("#sp-cc-accept, button:has-text('Accept')").first
-            if cookie_button.count() > 0:
-                cookie_button.click()
-                page.wait_for_timeout(1000)
+            page.wait_for_selector(
+                ".a-price, #priceblock_ourprice, #priceblock_dealprice",
+                state="attached", timeout=5000
+            )
+        except:
+            pass
+
+        # クッキー同意ボタンをクリック（存在する場合・短いタイムアウトで試行）
+        try:
+            page.locator("#sp-cc-accept, button:has-text('Accept')").first.click(
+                timeout=500, no_wait_after=True
+            )
         except:
             pass
         
         # 価格を取得（ページを「見る」だけの動作）
         # 注意: これは技術的にはスクレイピングですが、ユーザーがブラウザで確認するのと同様の動作です
-        price_selectors = [
-            ".a-price-whole",
-            "#priceblock_ourprice",
-            "#priceblock_dealprice",
-            ".a-price .a-offscreen",
-            "span.a-price",
-        ]
-        
+        # レンダリング済みHTMLを1回だけ取り出し、セレクタの探索は
+        # lxmlでプロセス内処理する（セレクタごとのPlaywright往復をなくす）
         amazon_price = None
         amazon_url = None
-        
-        for selector in price_selectors:
-            try:
-                price_elem = page.locator(selector).first
-                if price_elem.count() > 0:
-                    price_text = price_elem.inner_text().strip()
-                    price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                    if price_match:
-                        amazon_price = float(price_match.group().replace(',', ''))
-                        print(f"  Amazon価格を確認: ¥{int(amazon_price)}")
-                        
-                        # 最初の商品リンクを取得
-                        try:
-                            product_link = page.locator("a[href*='/dp/']").first
-                            if product_link.count() > 0:
-                                href = product_link.get_attribute("href")
-                                if href:
-                                    if href.startswith("/"):
-                                        amazon_url = f"https://www.amazon.co.jp{href.split('?')[0]}"
-                                    else:
-                                        amazon_url = href.split("?")[0].split("#")[0]
-                        except:
-                            pass
-                        
-                        break
-            except:
-                continue
-        
+
+        parsed = parse_amazon_search_price(page.content())
+        if parsed is not None:
+            amazon_price, amazon_url = parsed
+            print(f"  Amazon価格を確認: ¥{int(amazon_price)}")
+
         if amazon_price is None:
             print("  ⚠️  Amazon価格を取得できませんでした（手動確認が必要）")
             # ユーザーに手動で確認してもらう
@@ -172,85 +180,101 @@ def main():
         print("=" * 60)
         mercari_url = f"https://www.mercari.com/jp/search/?keyword={search_keyword}"
         
-        with MercariScraper(headless=False) as mercari_scraper:
-            item_links = mercari_scraper.scrape_list(mercari_url)
-            
-            if item_links:
-                print(f"\n{len(item_links)} 件の商品リンクを発見しました。")
-                print("10件の商品情報を取得します...\n")
-                
-                for i, item_url in enumerate(item_links[:10]):  # 最大10件
-                    print(f"\n{'='*60}")
-                    print(f"メルカリ商品 {i+1}/10 を取得中...")
-                    print('='*60)
-                    
-                    try:
-                        item_info = mercari_scraper.scrape_detail(item_url)
-                        if item_info:
-                            title = item_info.get('title', '')
-                            price = item_info.get('price', '')
-                            if title and len(title) > 5 and price:
-                                mercari_items.append(item_info)
-                                print(f"✓ 取得完了: {title[:50]} ({price})")
-                    except Exception as e:
-                        print(f"⚠️  エラー: {e}")
-                    
-                    time.sleep(2)
+        # リスト取得と詳細取得をパイプライン実行する
+        # （最初のリンクが見つかった時点で詳細取得が始まる）
+        mercari_scraper = MercariScraper(headless=False)
+        for item_info in mercari_scraper.scrape_pipeline(
+            mercari_url, max_workers=MAX_PARALLEL_PAGES, limit=10
+        ):
+            if item_info:
+                title = item_info.get('title', '')
+                price = item_info.get('price', '')
+                if title and len(title) > 5 and price:
+                    mercari_items.append(item_info)
+                    print(f"✓ 取得完了: {title[:50]} ({price})")
         
         # Amazonの価格を確認（閲覧モード）
         print("\n" + "=" * 60)
         print("2. Amazonの価格を確認中（閲覧モード）...")
         print("=" * 60)
         
-        # 新しいブラウザセッションでAmazonを確認
-        from common.base_scraper import BaseScraper
-        from playwright.sync_api import sync_playwright
-        
-        playwright = sync_playwright().start()
-        browser = playwright.chromium.launch(headless=False)
-        page = browser.new_page()
-        
-        try:
-            for i, mercari_item in enumerate(mercari_items):
-                print(f"\n{'='*60}")
-                print(f"Amazon価格確認 {i+1}/{len(mercari_items)}")
-                print('='*60)
-                
-                mercari_title = mercari_item.get('title', '')
-                mercari_price = extract_price(mercari_item.get('price', ''))
-                
-                print(f"メルカリ商品: {mercari_title[:50]}")
-                print(f"メルカリ価格: {mercari_item.get('price', '')}")
-                
-                if mercari_price == float('inf'):
-                    print("  ⚠️  メルカリ価格が取得できませんでした。スキップします。")
-                    continue
-                
-                # Amazonの価格を確認（閲覧モード）
-                amazon_price, amazon_url, price_difference = get_amazon_price_by_viewing(
-                    page, mercari_title, mercari_price
-                )
-                
-                if amazon_price is not None and price_difference is not None:
-                    if price_difference > 0:  # Amazonの方が高い場合
-                        item = mercari_item.copy()
-                        item['amazon_price'] = f"¥{int(amazon_price)}"
-                        item['amazon_url'] = amazon_url or ""
-                        item['price_difference'] = f"¥{int(price_difference)}"
-                        cheaper_items.append(item)
-                        print(f"  ✓ Amazonより安い商品を発見！差額: ¥{int(price_difference)}")
-                    else:
-                        print(f"  Amazon価格: ¥{int(amazon_price)} (メルカリの方が高い)")
-                
-                time.sleep(3)  # リクエスト間隔を空ける
-        
-        finally:
-            browser.close()
-            playwright.stop()
+        # 商品ごとのAmazon確認をワーカースレッドで並列実行する。
+        # PlaywrightのSync APIはスレッド束縛のため、フォールバックが必要に
+        # なったワーカーは自分のスレッド専用のブラウザを起動して使い回し、
+        # バッチ完了後にまとめて閉じる。ページ読み込みのI/O待ちが重なり、
+        # 商品ごとの固定スリープも不要になる。
+        from common.base_scraper import (
+            get_shared_browser, _close_thread_browsers, _route_heavy_resources
+        )
+
+        def check_against_amazon(mercari_item: dict) -> tuple:
+            """1商品分のAmazon価格確認（ワーカースレッドで実行される）"""
+            mercari_title = mercari_item.get('title', '')
+            mercari_price = extract_price(mercari_item.get('price', ''))
+
+            print(f"\nメルカリ商品: {mercari_title[:50]}")
+            print(f"メルカリ価格: {mercari_item.get('price', '')}")
+
+            if mercari_price == float('inf'):
+                print("  ⚠️  メルカリ価格が取得できませんでした。スキップします。")
+                return None, None, None
+
+            # まずhttpxの高速パスを試す（ブラウザ不要ならページも開かない）
+            fast_result = get_amazon_price_fast(mercari_title, mercari_price)
+            if fast_result is not None:
+                return fast_result
+
+            # 価格ノードが取れなかった場合のみPlaywrightにフォールバック
+            # （価格テキストを読むだけなのでヘッドレスで十分）
+            browser = get_shared_browser(headless=True)
+            context = browser.new_context()
+            # 価格のテキストしか読まないため、画像等の重いリソースはブロックする
+            context.route("**/*", _route_heavy_resources)
+            page = context.new_page()
+            try:
+                return get_amazon_price_by_viewing(page, mercari_title, mercari_price)
+            finally:
+                # ブラウザはこのスレッド内で使い回すため閉じず、
+                # この商品用のコンテキストだけ閉じる
+                context.close()
+
+        with ThreadPoolExecutor(max_workers=AMAZON_VIEW_WORKERS) as executor:
+            results = list(executor.map(check_against_amazon, mercari_items))
+
+            # このエグゼキュータのスレッドは使い捨てのため、各ワーカーが
+            # フォールバックで起動したブラウザをスレッドごとに閉じてから
+            # 終了する（バリアで待ち合わせ、全スレッドが1回ずつ実行する）
+            cleanup_barrier = threading.Barrier(AMAZON_VIEW_WORKERS)
+
+            def cleanup_worker(_):
+                cleanup_barrier.wait()
+                _close_thread_browsers()
+
+            list(executor.map(cleanup_worker, range(AMAZON_VIEW_WORKERS)))
+
+        for mercari_item, (amazon_price, amazon_url, price_difference) in zip(
+            mercari_items, results
+        ):
+            if amazon_price is not None and price_difference is not None:
+                if price_difference > 0:  # Amazonの方が高い場合
+                    item = mercari_item.copy()
+                    item['amazon_price'] = f"¥{int(amazon_price)}"
+                    item['amazon_url'] = amazon_url or ""
+                    item['price_difference'] = f"¥{int(price_difference)}"
+                    # ソート用に数値も保持（整形済み文字列を再解析しない）
+                    item['_price_diff_num'] = price_difference
+                    cheaper_items.append(item)
+                    print(f"  ✓ Amazonより安い商品を発見！差額: ¥{int(price_difference)}")
+                else:
+                    print(f"  Amazon価格: ¥{int(amazon_price)} (メルカリの方が高い)")
         
         # 価格差でソート（大きい順）
-        cheaper_items.sort(key=lambda x: extract_price(x.get('price_difference', '¥0')), reverse=True)
+        cheaper_items.sort(key=itemgetter('_price_diff_num'), reverse=True)
         cheaper_items = cheaper_items[:5]  # 最大5件
+
+        # 内部用の数値キーはCSVに出さない
+        for item in cheaper_items:
+            del item['_price_diff_num']
         
         # 結果を表示・保存
         if cheaper_items:
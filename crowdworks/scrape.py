@@ -13,8 +13,16 @@ import time
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from crowdworks.scraper import CrowdWorksScraper
+from common.cache import UrlCache, fetch_details_with_cache
 from common.utils import save_to_csv
 
+# 詳細ページ取得の同時実行数（I/O待ちを重ねるため並列で取得する）
+MAX_PARALLEL_JOBS = 3
+
+# 案件詳細キャッシュの有効期間（秒）。応募期限・応募者数の変化を
+# 追うため、商品詳細より短めの1時間にする
+CACHE_TTL = 3600.0
+
 
 def main():
     """
@@ -36,6 +44,9 @@ def main():
     jobs_data = []
 
     try:
+        # 案件詳細のディスクキャッシュ（--no-cacheで毎回取得に戻せる）
+        cache = None if '--no-cache' in sys.argv else UrlCache(ttl=CACHE_TTL)
+
         with CrowdWorksScraper(headless=False) as scraper:
             # 案件一覧ページから案件リンクを取得
             job_links = scraper.scrape_list(target_url)
@@ -45,19 +56,18 @@ def main():
                 return
 
             print(f"\n{len(job_links)} 件の案件リンクを発見しました。")
-            print(f"{min(max_jobs, len(job_links))} 件の案件情報を取得します...\n")
-
-            # 案件情報を取得
-            for i, job_url in enumerate(job_links[:max_jobs]):
-                print(f"\n{'='*60}")
-                print(f"案件 {i+1}/{min(max_jobs, len(job_links))} を取得中...")
-                print('='*60)
-                
-                job_info = scraper.scrape_detail(job_url)
-
+            print(f"{min(max_jobs, len(job_links))} 件の案件情報を並列取得します...\n")
+
+            # 案件情報を取得（逐次ループの代わりにワーカースレッドで
+            # 並列取得し、goto＋読み込み待ちのI/O待ちを重ねる）
+            results = fetch_details_with_cache(
+                scraper, job_links[:max_jobs], cache,
+                max_workers=MAX_PARALLEL_JOBS
+            )
+            for job_info in results:
                 if job_info:
                     jobs_data.append(job_info)
-                    print(f"\n✓ 取得完了: {job_info.get('title', 'タイトル不明')[:50]}")
+                    print(f"✓ 取得完了: {job_info.get('title', 'タイトル不明')[:50]}")
 
             # 結果を表示・保存
             if jobs_data:
@@ -6,12 +6,51 @@ CrowdWorks案件情報スクレイパー
 
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional
 import re
+from urllib.parse import urljoin
+
+import httpx
+from lxml import html as lxml_html
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 # 親ディレクトリのパスを追加して共通モジュールをインポート
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from common.base_scraper import BaseScraper
+from common.http import get as http_get
+from common.http_fetcher import DEFAULT_HEADERS
+
+# 案件詳細のJSON APIエンドポイント（取れればブラウザ起動を丸ごと省ける）
+_API_URL = "https://crowdworks.jp/api/public/jobs/{job_id}"
+
+# ホットループで毎回組み立てないよう、モジュールレベルでコンパイル済みの正規表現を用意
+_JOB_ID_RE = re.compile(r'/jobs/(\d+)(?:/|$)')
+_PRICE_RE = re.compile(r'([0-9,]+[万円円]+)')
+_DEADLINE_RE = re.compile(r'応募期限\s*(\d{4}年\d{1,2}月\d{1,2}日)')
+# 除外パターン7種の部分文字列スキャンを1回の正規表現検索にまとめる
+_EXCLUDE_RE = re.compile(r'/(?:category/|group/|search|login|signup|help|about)')
+
+# 相対リンクを絶対URLに解決する際の基準URL
+_BASE_URL = "https://crowdworks.jp/"
+
+
+def _first_text(tree, xpaths, accept) -> str:
+    """
+    XPath候補を優先順に評価し、条件を満たす最初のテキストを返す
+
+    タプルで渡した場合は先頭のXPathから順に評価する。ユニオン1本に
+    まとめるとlxmlはマッチを文書順で返すため、セレクタの優先順位は
+    ここでのループ順で制御する。文字列の場合は単一のXPathとして扱う。
+    """
+    if isinstance(xpaths, str):
+        xpaths = (xpaths,)
+    for xpath in xpaths:
+        for element in tree.xpath(xpath):
+            text = element.text_content().strip()
+            if accept(text):
+                return text
+    return ""
 
 
 class CrowdWorksScraper(BaseScraper):
@@ -19,74 +58,177 @@ class CrowdWorksScraper(BaseScraper):
     CrowdWorksの案件情報をスクレイピングするクラス
     """
 
-    def scrape_list(self, url: str, wait_time: int = 3000) -> List[str]:
+    # 結合済みセレクタは呼び出しごとに組み立てず、クラス属性として1回だけ持つ
+    _LIST_SELECTOR = (
+        "a[href*='/public/jobs/'], a[href*='/jobs/'], "
+        ".job-item a, .job-list-item a, [data-job-id] a, "
+        "article a, .card a"
+    )
+    _TITLE_SELECTOR = "h1.job-title, h1, .job-title, [data-job-title]"
+
+    # フィールド抽出はpage.content()のHTMLをlxmlで解析するため、XPathで持つ
+    _TITLE_XPATH = (
+        '//h1[contains(@class, "job-title")] | //h1 | '
+        '//*[contains(@class, "job-title")] | //*[@data-job-title]'
+    )
+    _DESC_XPATH = (
+        '//*[contains(@class, "job-description")] | '
+        '//*[contains(@class, "description")] | //*[@data-description] | '
+        '//*[contains(@class, "job-detail")] | '
+        '//*[contains(@class, "detail-content")] | '
+        '//article//*[contains(@class, "content")]'
+    )
+    # 価格のXPath候補（優先順）。ユニオン1本だと文書順で返るため、
+    # ページ先頭の手数料表記などのspanが[data-price]要素を覆い隠す。
+    # 専用セレクタから順に試し、汎用のspan/ddは最後の手段にする
+    _PRICE_XPATHS = (
+        '//*[@data-price]',
+        '//*[contains(@class, "price")]',
+        '//*[contains(@class, "budget")]',
+        '//span | //dd',
+    )
+
+    def __init__(self, headless: bool = False, browser_type: str = "chromium"):
+        super().__init__(headless=headless, browser_type=browser_type)
+        # JSON APIのヒット率の記録（エンドポイント変更の検知用）
+        self.api_attempts = 0
+        self.api_hits = 0
+
+    def _try_api_fetch(self, job_url: str) -> Optional[Dict[str, Any]]:
         """
-        案件一覧ページから案件リンクを取得
+        JSON APIから案件情報の取得を試みる
+
+        成功すればブラウザでのレンダリングを丸ごと省略できます。
+        エンドポイントが使えない・スキーマが合わない場合はNoneを返し、
+        呼び出し側がPlaywrightにフォールバックします。
+
+        Input:
+            job_url: 案件詳細ページのURL
+
+        Output:
+            Optional[Dict[str, Any]]: 案件情報の辞書（取得できない場合はNone）
+        """
+        id_match = _JOB_ID_RE.search(job_url)
+        if not id_match:
+            return None
+
+        self.api_attempts += 1
+        try:
+            resp = http_get(
+                _API_URL.format(job_id=id_match.group(1)),
+                headers=DEFAULT_HEADERS, timeout=5
+            )
+            if resp.status_code != 200:
+                return None
+            payload = resp.json()
+        except (httpx.HTTPError, ValueError):
+            # 通信エラーとJSONでないレスポンスだけ握りつぶしてブラウザに回す
+            return None
+
+        # 配列などオブジェクト以外のJSONが返る場合もスキーマ不一致とみなす
+        if not isinstance(payload, dict):
+            return None
+
+        # スキーマの揺れに備えて、jobキー配下とトップレベルの両方を見る
+        job = payload.get("job") if isinstance(payload.get("job"), dict) else payload
+        title = job.get("title") or ""
+        if not title:
+            # タイトルが取れないレスポンスはスキーマ不一致とみなす
+            return None
+
+        self.api_hits += 1
+        return {
+            "url": job_url,
+            "title": title,
+            "description": (job.get("description") or "")[:5000],
+            "price": str(job.get("payment_text") or job.get("price") or ""),
+            "deadline": str(job.get("expired_on") or job.get("deadline") or ""),
+            "category": str(job.get("category_name") or job.get("category") or ""),
+            "skills": "",
+            "client_info": "",
+            "posted_date": str(job.get("posted_on") or ""),
+            "applicants": str(job.get("applicants_count") or ""),
+            "status": str(job.get("status") or ""),
+        }
+
+    def scrape_list_stream(self, url: str, wait_time: int = 3000) -> Iterator[str]:
+        """
+        案件一覧ページから案件リンクを検証できた順に返すジェネレータ
+
+        scrape_pipelineと組み合わせると、リンクが見つかった時点で
+        詳細取得を開始できます。
 
         Input:
             url: 案件一覧ページのURL
             wait_time: 読み込み待機時間(ミリ秒)
 
         Output:
-            List[str]: 案件詳細ページのURLリスト
+            Iterator[str]: 案件詳細ページのURL
         """
-        page = self.get_page()
-        job_links = []
+        # テキストとリンクしか読まないため、画像等の重いリソースはブロックする
+        page = self.get_page(block_resources=True)
 
         try:
             print(f"案件一覧ページにアクセス中: {url}")
             page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(wait_time)
-
-            # 案件リンクを探す
-            selectors = [
-                "a[href*='/public/jobs/']",
-                "a[href*='/jobs/']",
-                ".job-item a",
-                ".job-list-item a",
-                "[data-job-id] a",
-                "article a",
-                ".card a"
-            ]
-
-            exclude_patterns = [
-                "/category/",
-                "/group/",
-                "/search",
-                "/login",
-                "/signup",
-                "/help",
-                "/about"
-            ]
-
-            for selector in selectors:
-                try:
-                    links = page.locator(selector).all()
-                    if links:
-                        print(f"セレクタ '{selector}' で {len(links)} 件のリンクを発見")
-                        for link in links:
-                            href = link.get_attribute("href")
-                            if href and "/jobs/" in href:
-                                should_exclude = any(pattern in href for pattern in exclude_patterns)
-                                if should_exclude:
-                                    continue
-
-                                job_id_pattern = r'/jobs/(\d+)(?:/|$)'
-                                if re.search(job_id_pattern, href):
-                                    full_url = href if href.startswith("http") else f"https://crowdworks.jp{href}"
-                                    if full_url not in job_links:
-                                        job_links.append(full_url)
-                                        print(f"  案件リンク: {full_url}")
-
-                        if job_links:
-                            print(f"合計 {len(job_links)} 件の案件リンクを発見")
-                            break
-                except Exception as e:
-                    print(f"セレクタ '{selector}' でエラー: {e}")
-                    continue
+
+            # 固定スリープの代わりに案件リンクがDOMに現れた時点で先へ進む
+            # （読み込みが速ければ数百msで返り、wait_timeは上限として働く）
+            try:
+                page.wait_for_selector(
+                    self._LIST_SELECTOR, state="attached", timeout=wait_time
+                )
+            except PlaywrightTimeoutError:
+                pass  # リンクが1件もないページもあるため、そのまま抽出を試す
+
+            seen = set()  # O(1)の重複チェック用
+
+            # 全リンクのhrefを1回のJS評価でまとめて取得
+            # （リンクごとのget_attribute往復をなくし、CDP呼び出しを1回に集約）
+            try:
+                hrefs = page.eval_on_selector_all(
+                    self._LIST_SELECTOR,
+                    "els => Array.from(new Set(els.map(e => e.getAttribute('href'))))"
+                )
+            except PlaywrightError as e:
+                print(f"リンク取得でエラー: {e}")
+                hrefs = []
+
+            if hrefs:
+                print(f"{len(hrefs)} 件のリンク候補を発見")
+
+            for href in hrefs:
+                if href and "/jobs/" in href:
+                    if _EXCLUDE_RE.search(href):
+                        continue
+
+                    if _JOB_ID_RE.search(href):
+                        # urljoinはスキーム付き・プロトコル相対（//）・相対パスを
+                        # すべて正しく解決し、絶対URLはそのまま返す
+                        full_url = urljoin(_BASE_URL, href)
+                        if full_url not in seen:
+                            seen.add(full_url)
+                            yield full_url
 
         finally:
-            page.context.close()
+            # コンテキストは閉じずにプールへ返す（次の呼び出しで再利用される）
+            self.release_page(page)
+
+    def scrape_list(self, url: str, wait_time: int = 3000) -> List[str]:
+        """
+        案件一覧ページから案件リンクを取得
+
+        Input:
+            url: 案件一覧ページのURL
+            wait_time: 読み込み待機時間(ミリ秒)
+
+        Output:
+            List[str]: 案件詳細ページのURLリスト
+        """
+        job_links = list(self.scrape_list_stream(url, wait_time=wait_time))
+
+        if job_links:
+            print(f"合計 {len(job_links)} 件の案件リンクを発見")
 
         return job_links
 
@@ -101,12 +243,27 @@ class CrowdWorksScraper(BaseScraper):
         Output:
             Dict[str, Any]: 案件情報の辞書
         """
-        page = self.get_page()
+        # まずJSON APIを試す（成功すればブラウザを使わずに返せる）
+        job_info = self._try_api_fetch(job_url)
+        if job_info is not None:
+            print(f"\n案件情報をAPIから取得: {job_url}")
+            return job_info
+
+        # 案件情報はテキストのみのため、画像等の重いリソースはブロックする
+        page = self.get_page(block_resources=True)
 
         try:
             print(f"\n案件詳細ページにアクセス中: {job_url}")
             page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(wait_time)
+
+            # 固定スリープの代わりにタイトル要素の出現を待つ
+            # （出現した時点で即座に先へ進み、wait_timeは上限として働く）
+            try:
+                page.wait_for_selector(
+                    self._TITLE_SELECTOR, state="attached", timeout=wait_time
+                )
+            except PlaywrightTimeoutError:
+                pass  # タイトルが取れない場合は<title>タグのフォールバックに任せる
 
             job_info = {
                 "url": job_url,
@@ -122,85 +279,66 @@ class CrowdWorksScraper(BaseScraper):
                 "status": "",
             }
 
-            # タイトルを取得
-            title_selectors = ["h1.job-title", "h1", ".job-title", "[data-job-title]"]
-            for selector in title_selectors:
-                try:
-                    title_elem = page.locator(selector).first
-                    if title_elem.count() > 0:
-                        title_text = title_elem.inner_text().strip()
-                        if title_text and "クラウドワークス" not in title_text:
-                            job_info["title"] = title_text
-                            if job_info["title"]:
-                                break
-                except:
-                    continue
-
-            if not job_info["title"]:
-                try:
-                    title_tag = page.title()
+            # レンダリング済みHTMLを1回だけ取り出し、フィールド抽出は
+            # lxmlでプロセス内処理する（フィールド・フォールバックごとの
+            # CDP往復が、HTMLの転送1回にまとまる）
+            try:
+                tree = lxml_html.fromstring(page.content())
+            except (PlaywrightError, lxml_html.etree.ParserError) as e:
+                print(f"  案件情報の抽出でエラー: {e}")
+                tree = None
+
+            if tree is not None:
+                title = _first_text(
+                    tree, self._TITLE_XPATH,
+                    lambda t: t and "クラウドワークス" not in t
+                )
+                if title:
+                    job_info["title"] = title
+                else:
+                    # セレクタで取れなかった場合は同じツリーの<title>タグを読む
+                    title_tag = tree.findtext(".//title") or ""
                     if "のお仕事" in title_tag:
                         job_info["title"] = title_tag.split("のお仕事")[0].strip()
-                except:
-                    pass
-
-            # 説明を取得
-            desc_selectors = [
-                ".job-description", ".description", "[data-description]",
-                ".job-detail", ".detail-content", "article .content"
-            ]
-            for selector in desc_selectors:
-                try:
-                    desc_elem = page.locator(selector).first
-                    if desc_elem.count() > 0:
-                        desc_text = desc_elem.inner_text().strip()
-                        if desc_text and len(desc_text) > 50:
-                            job_info["description"] = desc_text[:5000]
-                            if job_info["description"]:
-                                break
-                except:
-                    continue
-
-            # 価格を取得
-            page_text = page.inner_text("body")
-            price_selectors = [
-                "[data-price]", ".price", ".budget", ".job-budget",
-                "span:has-text('円')", "dd:has-text('円')"
-            ]
-            for selector in price_selectors:
-                try:
-                    price_elem = page.locator(selector).first
-                    if price_elem.count() > 0:
-                        price_text = price_elem.inner_text().strip()
-                        if price_text and ("円" in price_text or "¥" in price_text):
-                            price_match = re.search(r'([0-9,]+[万円円]+)', price_text)
-                            if price_match:
-                                job_info["price"] = price_match.group(1)
-                            else:
-                                job_info["price"] = price_text
-                            if job_info["price"]:
-                                break
-                except:
-                    continue
-
-            # その他の情報を取得
-            if not job_info["price"]:
-                price_match = re.search(r'([0-9,]+[万円円]+)', page_text)
-                if price_match:
-                    job_info["price"] = price_match.group(1)
-
-            # 応募期限、掲載日、応募者数などを取得
-            try:
-                deadline_elem = page.locator("text=応募期限").first
-                if deadline_elem.count() > 0:
-                    parent = deadline_elem.locator("..")
-                    if parent.count() > 0:
-                        deadline_text = parent.inner_text().strip()
-                        date_match = re.search(r'応募期限\s*(\d{4}年\d{1,2}月\d{1,2}日)', deadline_text)
-                        if date_match:
-                            job_info["deadline"] = date_match.group(1)
-            except:
-                pass
+
+                description = _first_text(
+                    tree, self._DESC_XPATH, lambda t: t and len(t) > 50
+                )
+                if description:
+                    job_info["description"] = description[:5000]
+
+                price_text = _first_text(
+                    tree, self._PRICE_XPATHS,
+                    lambda t: t and ("円" in t or "¥" in t)
+                )
+                if price_text:
+                    price_match = _PRICE_RE.search(price_text)
+                    if price_match:
+                        job_info["price"] = price_match.group(1)
+                    else:
+                        job_info["price"] = price_text
+
+                # 価格のフォールバック。まず取得済みの説明文を調べ、
+                # 見つからない場合のみmain/article部分木（なければ全文）を読む。
+                # 長文への正規表現スキャンは避け、C実装のstr.findで「円」を
+                # 探してその前後の小窓だけに正規表現をかける
+                if not job_info["price"]:
+                    price_match = _PRICE_RE.search(job_info["description"])
+                    if not price_match:
+                        subtree = tree.xpath("//main | //article")
+                        fallback_text = (subtree[0] if subtree else tree).text_content()
+                        idx = fallback_text.find("円")
+                        while idx != -1 and not price_match:
+                            window = fallback_text[max(0, idx - 32):idx + 4]
+                            price_match = _PRICE_RE.search(window)
+                            idx = fallback_text.find("円", idx + 1)
+                    if price_match:
+                        job_info["price"] = price_match.group(1)
+
+                # 応募期限も同じツリーの全文テキストから抽出する
+                date_match = _DEADLINE_RE.search(tree.text_content())
+                if date_match:
+                    job_info["deadline"] = date_match.group(1)
 
             return job_info
 
@@ -208,4 +346,4 @@ class CrowdWorksScraper(BaseScraper):
             print(f"案件詳細の取得でエラー: {e}")
             return None
         finally:
-            page.context.close()
+            self.release_page(page)
@@ -30,41 +30,116 @@ import sys
 import os
 from pathlib import Path
 from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import csv
-import time
 import re
 
+# 詳細ページ取得の同時実行数（I/O待ちを重ねるため並列で取得する）
+MAX_PARALLEL_PAGES = 4
+
+# 抽出用の正規表現はモジュール読み込み時に1回だけコンパイルする
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.S | re.I)
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+_H1_RE = re.compile(r'<h1[^>]*>(.*?)</h1>', re.S | re.I)
+_TITLE_TAG_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.S | re.I)
+# <title>から案件名部分だけを切り出す（「〜のお仕事」または「〜 | サイト名」）
+_TITLE_CLEAN_RE = re.compile(r'^(.+?)(?:のお仕事|\s*\|)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 日付表記のバリエーション（2024年1月1日 / 1/1 / 1月1日）
+_DATE_PATTERN = r'\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日'
+_ANY_DATE_RE = re.compile(r'(' + _DATE_PATTERN + r')')
+_NUM_RE = re.compile(r'(\d+)')
+_DEADLINE_RE = re.compile(r'応募期限\s*(' + _DATE_PATTERN + r')')
+_POSTED_RE = re.compile(r'掲載日\s*(' + _DATE_PATTERN + r')')
+_APPLICANTS_RE = re.compile(r'応募した人\s*(\d+)\s*人')
+_PRICE_LABELED_RE = re.compile(r'(?:報酬|予算)[：:]\s*([0-9,]+[万円円]+)')
+_PRICE_RE = re.compile(r'([0-9,]+[万円円]+)')
+_CATEGORY_PAREN_RE = re.compile(r'\(([^)]+)\)')
+_EC_CATEGORY_RE = re.compile(r'(ECサイト[^の\s]+)')
+_CLIENT_RE = re.compile(r'クライアント\s*([^\s].{0,199})')
+# 案件詳細ページのURLパターン（/public/jobs/数字 または /jobs/数字）
+_JOB_ID_RE = re.compile(r'/jobs/(\d+)(?:/|$)')
+# 除外パターン7種の部分文字列スキャンを1回の正規表現検索にまとめる
+_EXCLUDE_RE = re.compile(r'/(?:category/|group/|search|login|signup|help|about)')
+
+# テキスト抽出に不要な重いリソースタイプ（ページ読み込み時に中断する）
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# 各コンテキストで共通のUA文字列
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Chromiumの永続プロファイルの置き場所（実行をまたいでキャッシュを残す）
+_PROFILE_DIR = Path.home() / ".cache" / "cw_scraper_profile"
+
+
+def _route_heavy_resources(route):
+    """画像・フォント・メディアへのリクエストを中断するルートハンドラ"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
 # 03_e2eフォルダのパスを追加（直接importは禁止なので、コピーして使用）
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "03_e2e"))
 
 # 03_e2eのモジュールをコピーして使用（直接importは禁止）
 from playwright.sync_api import sync_playwright, Page, Browser
 
+from lxml import html as lxml_html
+
 
 class CrowdWorksScraper:
     """
     CrowdWorksの案件情報をスクレイピングするクラス
     """
 
-    def __init__(self, headless: bool = False, browser_type: str = "chromium"):
+    # CSV出力の列（scrape_job_detailが返す辞書のキーと同じ順序）
+    FIELDNAMES = (
+        "url", "title", "description", "price", "deadline", "category",
+        "skills", "client_info", "posted_date", "applicants", "status"
+    )
+
+    def __init__(self, headless: bool = False, browser_type: str = "chromium",
+                 debug: bool = False):
         """
         初期化
 
         Args:
             headless: ヘッドレスモードで実行するか
             browser_type: ブラウザタイプ ("chromium", "firefox", "webkit")
+            debug: 案件ごとにHTMLの一部をraw_htmlとして保持するか
         """
         self.headless = headless
         self.browser_type = browser_type
+        self.debug = debug
         self.playwright = None
         self.browser: Optional[Browser] = None
+        self.context = None
 
     def __enter__(self):
         """コンテキストマネージャー開始"""
         self.playwright = sync_playwright().start()
 
         if self.browser_type == "chromium":
-            self.browser = self.playwright.chromium.launch(headless=self.headless)
+            # 永続プロファイルで起動する。ディスクキャッシュ・Cookieが
+            # 実行をまたいで残るため、2回目以降は静的リソースがローカル
+            # キャッシュから返り、ナビゲーションが速くなる
+            try:
+                self.context = self.playwright.chromium.launch_persistent_context(
+                    user_data_dir=str(_PROFILE_DIR),
+                    headless=self.headless,
+                    viewport={"width": 1280, "height": 720},
+                    user_agent=_USER_AGENT,
+                )
+                self.browser = self.context.browser
+            except Exception:
+                # プロファイルは同時に1プロセスしか使えないため、並列ワーカー
+                # など2つ目以降のインスタンスは通常起動にフォールバックする
+                self.browser = self.playwright.chromium.launch(headless=self.headless)
         elif self.browser_type == "firefox":
             self.browser = self.playwright.firefox.launch(headless=self.headless)
         elif self.browser_type == "webkit":
@@ -72,11 +147,24 @@ class CrowdWorksScraper:
         else:
             raise ValueError(f"Unknown browser type: {self.browser_type}")
 
+        # コンテキストはページごとに作らず、起動時に1つだけ作って使い回す
+        # （Cookie・キャッシュ・UA初期化のコストをページごとに払わない）
+        if self.context is None:
+            self.context = self.browser.new_context(
+                viewport={"width": 1280, "height": 720},
+                user_agent=_USER_AGENT,
+            )
+        # テキストしか読まないため、画像等の重いリソースはブロックする
+        # （CSSはレイアウト依存の抽出が壊れないよう残す）
+        self.context.route("**/*", _route_heavy_resources)
+
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """コンテキストマネージャー終了"""
-        if self.browser:
+        if self.context:
+            self.context.close()
+        if self.browser and self.browser.is_connected():
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
@@ -87,18 +175,23 @@ class CrowdWorksScraper:
 
         Input:
             viewport_size: ビューポートサイズ {"width": 1280, "height": 720}
+                （指定時のみ単発のコンテキストを作成）
 
         Output:
             Page: PlaywrightのPageオブジェクト
         """
-        if not self.browser:
+        if not self.context:
             raise RuntimeError("Browser not initialized. Use context manager (with statement)")
 
-        context = self.browser.new_context(
-            viewport=viewport_size or {"width": 1280, "height": 720},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        return context.new_page()
+        # カスタムビューポート指定時のみ専用コンテキストを作成
+        if viewport_size is not None and self.browser:
+            context = self.browser.new_context(
+                viewport=viewport_size,
+                user_agent=_USER_AGENT,
+            )
+            return context.new_page()
+
+        return self.context.new_page()
 
     def scrape_jobs(
         self,
@@ -136,103 +229,224 @@ class CrowdWorksScraper:
                 except Exception as e2:
                     print(f"loadでもタイムアウト、commitを試行: {e2}")
                     page.goto(url, wait_until="commit", timeout=60000)
-            page.wait_for_timeout(wait_time)
-
-            # ページのHTMLを取得して構造を確認
-            html_content = page.content()
-            print(f"ページHTMLの長さ: {len(html_content)} 文字")
 
-            # 案件リンクを探す（複数のセレクタを試す）
+            # 固定スリープの代わりに案件リンクの出現を待つ
+            # （出現した時点で即座に先へ進む）
+            try:
+                page.wait_for_selector(
+                    "a[href*='/jobs/']", state="attached", timeout=10000
+                )
+            except Exception:
+                pass  # リンクが無いページでもそのまま抽出を試す
+
+            # 案件リンクを探す。/jobs/ を含む<a>だけが対象になり得るため、
+            # セレクタを順に試すDOM走査はやめて、1回のJS評価で全hrefを取得し
+            # Python側でコンパイル済み正規表現によりフィルタする
             job_links = []
-            
-            # 一般的なセレクタパターンを試す
-            selectors = [
-                "a[href*='/public/jobs/']",
-                "a[href*='/jobs/']",
-                ".job-item a",
-                ".job-list-item a",
-                "[data-job-id] a",
-                "article a",
-                ".card a"
-            ]
-
-            # 除外するURLパターン（カテゴリーページなど）
-            exclude_patterns = [
-                "/category/",
-                "/group/",
-                "/search",
-                "/login",
-                "/signup",
-                "/help",
-                "/about"
-            ]
-
-            for selector in selectors:
-                try:
-                    links = page.locator(selector).all()
-                    if links:
-                        print(f"セレクタ '{selector}' で {len(links)} 件のリンクを発見")
-                        for link in links:
-                            href = link.get_attribute("href")
-                            if href and "/jobs/" in href:
-                                # 除外パターンをチェック
-                                should_exclude = any(pattern in href for pattern in exclude_patterns)
-                                if should_exclude:
-                                    continue
-                                
-                                # 案件詳細ページのURLパターンをチェック（/public/jobs/数字 の形式）
-                                # または /jobs/数字 の形式
-                                job_id_pattern = r'/jobs/(\d+)(?:/|$)'
-                                if re.search(job_id_pattern, href):
-                                    full_url = href if href.startswith("http") else f"https://crowdworks.jp{href}"
-                                    if full_url not in job_links:
-                                        job_links.append(full_url)
-                                        print(f"  案件リンク: {full_url}")
-                                        
-                        if job_links:
-                            print(f"合計 {len(job_links)} 件の案件リンクを発見")
-                            break
-                except Exception as e:
-                    print(f"セレクタ '{selector}' でエラー: {e}")
-                    continue
-
-            # リンクが見つからない場合、ページのテキストを確認
+            seen = set()  # O(1)の重複チェック用
+
+            try:
+                hrefs = page.eval_on_selector_all(
+                    "a[href*='/jobs/']",
+                    "els => els.map(e => e.getAttribute('href'))"
+                )
+            except Exception as e:
+                print(f"リンク取得でエラー: {e}")
+                hrefs = []
+
+            if hrefs:
+                print(f"{len(hrefs)} 件のリンク候補を発見")
+
+            for href in hrefs:
+                if href and "/jobs/" in href:
+                    # 除外パターン（カテゴリーページなど）をチェック
+                    if _EXCLUDE_RE.search(href):
+                        continue
+
+                    # 案件詳細ページのURLパターンをチェック
+                    # （/public/jobs/数字 または /jobs/数字 の形式）
+                    if _JOB_ID_RE.search(href):
+                        full_url = href if href.startswith("http") else f"https://crowdworks.jp{href}"
+                        if full_url not in seen:
+                            seen.add(full_url)
+                            job_links.append(full_url)
+                            print(f"  案件リンク: {full_url}")
+
+            if job_links:
+                print(f"合計 {len(job_links)} 件の案件リンクを発見")
+
+            # リンクが見つからない場合のみ、ページのHTMLとテキストを取得して確認
+            # （成功パスでは全文のシリアライズを一切行わない）
             if not job_links:
                 print("案件リンクが見つかりません。ページ構造を確認します...")
+                html_content = page.content()
+                print(f"ページHTMLの長さ: {len(html_content)} 文字")
                 page_text = page.inner_text("body")
                 print(f"ページテキストの最初の500文字:\n{page_text[:500]}")
-                
-                # HTMLの一部を保存して確認
-                output_dir = Path(__file__).parent.parent / "98_tmp"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                html_file = output_dir / "page_structure.html"
-                with open(html_file, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                print(f"HTMLを保存しました: {html_file}")
+
+                # HTML全体のディスク保存はデバッグ時のみ行う
+                if self.debug:
+                    output_dir = Path(__file__).parent.parent / "98_tmp"
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    html_file = output_dir / "page_structure.html"
+                    with open(html_file, "w", encoding="utf-8") as f:
+                        f.write(html_content)
+                    print(f"HTMLを保存しました: {html_file}")
 
             # 見つかったリンクから案件情報を取得
-            for idx, job_url in enumerate(job_links[:max_jobs]):
-                print(f"\n案件 {idx + 1}/{min(len(job_links), max_jobs)} を取得中: {job_url}")
-                
-                job_info = self.scrape_job_detail(page, job_url, wait_time)
-                if job_info:
-                    jobs_data.append(job_info)
-                    print(f"取得したデータ: {job_info}")
-
-                # 1件取得後に停止
-                if stop_after_first and len(jobs_data) >= 1:
-                    print("\n" + "="*50)
-                    print("1件のデータを取得しました。確認をお願いします。")
-                    print("="*50)
-                    print(f"取得したデータ:\n{self._format_job_data(jobs_data[0])}")
-                    print("\n続行する場合は、スクリプトを再実行してください。")
-                    break
+            if stop_after_first:
+                # 確認フローは従来どおり同じページで1件ずつ取得する
+                for idx, job_url in enumerate(job_links[:max_jobs]):
+                    print(f"\n案件 {idx + 1}/{min(len(job_links), max_jobs)} を取得中: {job_url}")
+
+                    job_info = self.scrape_job_detail(page, job_url, wait_time)
+                    if job_info:
+                        jobs_data.append(job_info)
+                        print(f"取得したデータ: {job_info}")
+
+                    # 1件取得後に停止
+                    if len(jobs_data) >= 1:
+                        print("\n" + "="*50)
+                        print("1件のデータを取得しました。確認をお願いします。")
+                        print("="*50)
+                        print(f"取得したデータ:\n{self._format_job_data(jobs_data[0])}")
+                        print("\n続行する場合は、スクリプトを再実行してください。")
+                        break
+            else:
+                # 複数件の取得はワーカースレッドで並列実行する
+                # （所要時間がおよそ N×T から ceil(N/ワーカー数)×T になる）
+                results = self.scrape_job_details_batch(
+                    job_links[:max_jobs], wait_time=wait_time
+                )
+                for job_info in results:
+                    if job_info:
+                        jobs_data.append(job_info)
 
         finally:
-            page.context.close()
+            # 共有コンテキストは閉じず、ページだけ閉じる
+            # （カスタムビューポートの単発コンテキストはここで片付ける）
+            page_context = page.context
+            page.close()
+            if page_context is not self.context:
+                page_context.close()
 
         return jobs_data
 
+    def scrape_job_details_batch(
+        self,
+        job_urls: List[str],
+        wait_time: int = 3000,
+        max_workers: int = MAX_PARALLEL_PAGES
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        複数の案件詳細ページを並列で取得
+
+        待ち時間の大半はページ読み込みのI/O待ちのため、並列化で重ねられます。
+        PlaywrightのSync APIオブジェクトは生成スレッドに束縛されるため、
+        ワーカースレッドごとに自分のスクレイパーを起動します。
+
+        Input:
+            job_urls: 案件詳細ページのURLリスト
+            wait_time: 読み込み待機時間(ミリ秒)
+            max_workers: 同時実行数
+
+        Output:
+            List[Optional[Dict[str, Any]]]: job_urlsと同じ順序の取得結果（失敗はNone）
+        """
+        if not job_urls:
+            return []
+
+        def worker(job_url: str) -> Optional[Dict[str, Any]]:
+            try:
+                with CrowdWorksScraper(
+                    headless=self.headless, browser_type=self.browser_type,
+                    debug=self.debug
+                ) as scraper:
+                    worker_page = scraper.get_page()
+                    try:
+                        return scraper.scrape_job_detail(worker_page, job_url, wait_time)
+                    finally:
+                        worker_page.close()
+            except Exception as e:
+                print(f"  詳細取得エラー ({job_url}): {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(worker, job_urls))
+
+    def scrape_job_details_to_csv(
+        self,
+        job_urls: List[str],
+        output_path: str,
+        wait_time: int = 3000,
+        max_workers: int = MAX_PARALLEL_PAGES,
+        encoding: str = "utf-8-sig"
+    ) -> int:
+        """
+        複数の案件詳細を並列取得し、完了した順にCSVへ直接書き出す
+
+        scrape_job_details_batchは全件の結果をリストに溜めてから返すため、
+        数千件のバッチでは常駐メモリが件数に比例して増えます。こちらは
+        1件完了するたびにディスクへ書き出して結果を手放すため、常駐は
+        ワーカー数分（O(max_workers)）に収まり、最初の行が書かれるのは
+        最初の1件が完了した時点になります。行の順序は完了順です。
+
+        Input:
+            job_urls: 案件詳細ページのURLリスト
+            output_path: 出力ファイルパス
+            wait_time: 読み込み待機時間(ミリ秒)
+            max_workers: 同時実行数
+            encoding: エンコーディング（デフォルト: utf-8-sig for Excel）
+
+        Output:
+            int: 書き出した件数
+        """
+        if not job_urls:
+            print("保存するデータがありません。")
+            return 0
+
+        output_path_obj = Path(output_path)
+        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+        # 列は固定。raw_htmlはdebug時のみ付く
+        fieldnames = list(self.FIELDNAMES)
+        if self.debug:
+            fieldnames.append("raw_html")
+
+        def worker(job_url: str) -> Optional[Dict[str, Any]]:
+            try:
+                with CrowdWorksScraper(
+                    headless=self.headless, browser_type=self.browser_type,
+                    debug=self.debug
+                ) as scraper:
+                    worker_page = scraper.get_page()
+                    try:
+                        return scraper.scrape_job_detail(worker_page, job_url, wait_time)
+                    finally:
+                        worker_page.close()
+            except Exception as e:
+                print(f"  詳細取得エラー ({job_url}): {e}")
+                return None
+
+        saved = 0
+        with open(output_path, "w", newline="", encoding=encoding) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(worker, url) for url in job_urls]
+                for future in as_completed(futures):
+                    job_info = future.result()
+                    if not job_info:
+                        continue
+                    writer.writerow(tuple(job_info.get(key, "") for key in fieldnames))
+                    # 途中で落ちても完了分は読めるよう、1行ごとに書き切る
+                    f.flush()
+                    saved += 1
+
+        print(f"CSVファイルを保存しました: {output_path}（{saved}件）")
+        return saved
+
     def scrape_job_detail(
         self,
         page: Page,
@@ -261,7 +475,21 @@ class CrowdWorksScraper:
                 except Exception as e2:
                     print(f"詳細ページのloadでもタイムアウト、commitを試行: {e2}")
                     page.goto(job_url, wait_until="commit", timeout=60000)
-            page.wait_for_timeout(wait_time)
+
+            # 固定スリープの代わりにタイトル要素の出現を待つ
+            try:
+                page.wait_for_selector("h1", state="attached", timeout=10000)
+            except Exception:
+                pass  # タイトルが無くても各フォールバックで抽出を試す
+
+            # ページのHTMLを1回だけ取り出し、以降の抽出はすべて
+            # プロセス内のコンパイル済み正規表現で行う
+            # （フィールド・フォールバックごとのlocator往復をなくす）
+            html_content = page.content()
+
+            # script/styleを中身ごと落としてからタグを剥がし、テキスト化する
+            text = _SCRIPT_STYLE_RE.sub(" ", html_content)
+            text = _TAG_STRIP_RE.sub(" ", text)
 
             job_info = {
                 "url": job_url,
@@ -275,359 +503,127 @@ class CrowdWorksScraper:
                 "posted_date": "",
                 "applicants": "",
                 "status": "",
-                "raw_html": page.content()[:5000]  # デバッグ用にHTMLの一部を保存
             }
 
-            # タイトルを取得（複数のセレクタを試す）
-            title_selectors = [
-                "h1.job-title",
-                "h1",
-                ".job-title",
-                "[data-job-title]",
-                "title"
-            ]
-            for selector in title_selectors:
-                try:
-                    if selector == "title":
-                        # titleタグの場合はinner_textではなくtext_contentを使用
-                        job_info["title"] = page.title()
-                        if job_info["title"] and "クラウドワークス" not in job_info["title"]:
-                            # titleタグから「のお仕事」の前までを取得
-                            if "のお仕事" in job_info["title"]:
-                                job_info["title"] = job_info["title"].split("のお仕事")[0].strip()
-                            break
-                    else:
-                        title_elem = page.locator(selector).first
-                        if title_elem.count() > 0:
-                            title_text = title_elem.inner_text().strip()
-                            if title_text and "クラウドワークス" not in title_text:
-                                job_info["title"] = title_text
-                                if job_info["title"]:
-                                    break
-                except Exception as e:
-                    continue
-            
-            # タイトルが取得できなかった場合、titleタグから取得
-            if not job_info["title"] or "クラウドワークス" in job_info["title"]:
-                try:
-                    title_tag = page.title()
-                    if "のお仕事" in title_tag:
-                        job_info["title"] = title_tag.split("のお仕事")[0].strip()
-                    elif "|" in title_tag:
-                        job_info["title"] = title_tag.split("|")[0].strip()
-                except:
-                    pass
-
-            # 説明を取得（複数のセレクタを試す）
-            desc_selectors = [
-                ".job-description",
-                ".description",
-                "[data-description]",
-                ".job-detail",
-                ".detail-content",
-                "article .content",
-                ".content-body",
-                ".job-detail-content",
-                "#job-detail",
-                "[class*='detail']",
-                "[class*='description']"
-            ]
-            for selector in desc_selectors:
-                try:
-                    desc_elem = page.locator(selector).first
-                    if desc_elem.count() > 0:
-                        desc_text = desc_elem.inner_text().strip()
-                        if desc_text and len(desc_text) > 50:  # 十分な長さがある場合
-                            job_info["description"] = desc_text[:2000]  # 最初の2000文字
-                            if job_info["description"]:
-                                break
-                except:
-                    continue
-            
-            # 説明が取得できなかった場合、「概要」セクションを探す
-            if not job_info["description"] or len(job_info["description"]) < 50:
-                try:
-                    # 「概要」というテキストを含む要素を探す
-                    overview_elem = page.locator("text=概要").first
-                    if overview_elem.count() > 0:
-                        # 親要素から説明を取得
-                        parent = overview_elem.locator("..")
-                        if parent.count() > 0:
-                            desc_text = parent.inner_text().strip()
-                            if desc_text and len(desc_text) > 50:
-                                job_info["description"] = desc_text[:2000]
-                        
-                        # 次の兄弟要素を取得
-                        if not job_info["description"] or len(job_info["description"]) < 50:
-                            try:
-                                next_sibling = overview_elem.locator("xpath=following-sibling::*[1]")
-                                if next_sibling.count() > 0:
-                                    desc_text = next_sibling.inner_text().strip()
-                                    if desc_text and len(desc_text) > 50:
-                                        job_info["description"] = desc_text[:2000]
-                            except:
-                                pass
-                except:
-                    pass
-            
-            # まだ説明が取得できていない場合、JavaScriptでページ構造を調べる
-            if not job_info["description"] or len(job_info["description"]) < 50:
-                try:
-                    # 「仕事の詳細」セクションを探す
-                    detail_section = page.locator("text=仕事の詳細").first
-                    if detail_section.count() > 0:
-                        # 次の要素を取得
-                        try:
-                            detail_content = detail_section.locator("xpath=following::*[contains(@class, 'content') or contains(@class, 'detail')][1]")
-                            if detail_content.count() > 0:
-                                desc_text = detail_content.inner_text().strip()
-                                if desc_text and len(desc_text) > 50:
-                                    job_info["description"] = desc_text[:2000]
-                        except:
-                            pass
-                except:
-                    pass
-
-            # 価格を取得
-            price_selectors = [
-                "[data-price]",
-                ".price",
-                ".budget",
-                ".job-budget",
-                "span:has-text('円')",
-                "span:has-text('¥')",
-                "dd:has-text('円')",
-                "dt:has-text('予算') + dd",
-                "dt:has-text('報酬') + dd",
-                "[class*='budget']",
-                "[class*='price']"
-            ]
-            for selector in price_selectors:
-                try:
-                    price_elem = page.locator(selector).first
-                    if price_elem.count() > 0:
-                        price_text = price_elem.inner_text().strip()
-                        if price_text and ("円" in price_text or "¥" in price_text or "万円" in price_text):
-                            # 数字と円を含む部分だけを抽出
-                            import re
-                            price_match = re.search(r'([0-9,]+[万円円]+)', price_text)
-                            if price_match:
-                                job_info["price"] = price_match.group(1)
-                            else:
-                                job_info["price"] = price_text
-                            if job_info["price"]:
-                                break
-                except:
-                    continue
-            
-            # 価格が取得できなかった場合、テキストから「円」を含む部分を探す
-            if not job_info["price"]:
+            # HTMLの一部はデバッグ時のみ保持する（案件あたり約5KBの常駐を避ける）
+            if self.debug:
+                job_info["raw_html"] = html_content[:5000]
+
+            # タイトル: まず<h1>、取れなければ<title>タグから
+            for h1_match in _H1_RE.finditer(html_content):
+                title_text = _TAG_STRIP_RE.sub(" ", h1_match.group(1)).strip()
+                if title_text and "クラウドワークス" not in title_text:
+                    job_info["title"] = title_text
+                    break
+            title_tag_match = _TITLE_TAG_RE.search(html_content)
+            title_tag = title_tag_match.group(1).strip() if title_tag_match else ""
+            if not job_info["title"] and title_tag:
+                clean_match = _TITLE_CLEAN_RE.match(title_tag)
+                if clean_match:
+                    job_info["title"] = clean_match.group(1).strip()
+
+            # 説明: 「仕事の詳細」セクション以降、なければ本文の先頭から
+            desc_idx = text.find("仕事の詳細")
+            desc_text = text[desc_idx:desc_idx + 4000] if desc_idx != -1 else text[:4000]
+            desc_text = _WHITESPACE_RE.sub(" ", desc_text).strip()
+            if len(desc_text) > 50:
+                job_info["description"] = desc_text[:2000]
+
+            # 価格: ラベル付き（報酬/予算）を優先し、なければ最初の金額表記
+            price_match = _PRICE_LABELED_RE.search(text) or _PRICE_RE.search(text)
+            if price_match:
+                job_info["price"] = price_match.group(1)
+
+            # 応募期限・掲載日・応募者数
+            deadline_match = _DEADLINE_RE.search(text)
+            if deadline_match:
+                job_info["deadline"] = deadline_match.group(1)
+
+            posted_match = _POSTED_RE.search(text)
+            if posted_match:
+                job_info["posted_date"] = posted_match.group(1)
+
+            applicants_match = _APPLICANTS_RE.search(text)
+            if applicants_match:
+                job_info["applicants"] = f"{applicants_match.group(1)}人"
+
+            # カテゴリー: <title>の「(カテゴリー名)」、なければ説明文から
+            category_match = _CATEGORY_PAREN_RE.search(title_tag)
+            if category_match:
+                job_info["category"] = category_match.group(1)
+            if not job_info["category"] and job_info["description"]:
+                if "ECサイト制作" in job_info["description"]:
+                    job_info["category"] = "ECサイト制作"
+                else:
+                    category_match = _EC_CATEGORY_RE.search(job_info["description"])
+                    if category_match:
+                        job_info["category"] = category_match.group(1)
+
+            # クライアント情報: 「クライアント」ラベルの後ろを切り出す
+            client_match = _CLIENT_RE.search(text)
+            if client_match:
+                job_info["client_info"] = client_match.group(1).strip()[:200]
+
+            # 正規表現で埋まらなかったラベル付きフィールドは、取得済みHTMLを
+            # lxmlで解析してラベル要素の隣（なければ親）を読む（dt/dd等の
+            # 構造はタグを剥がしたテキストでは見えないため）。DOMスナップ
+            # ショットはすでに手元にあるので、ブラウザへの追加往復はゼロ
+            if not all((job_info["price"], job_info["deadline"],
+                        job_info["posted_date"], job_info["applicants"],
+                        job_info["category"], job_info["client_info"])):
                 try:
-                    page_text = page.inner_text("body")
-                    # 「予算」や「報酬」の後に続く金額を探す
-                    price_patterns = [
-                        r'予算[：:]\s*([0-9,]+[万円円]+)',
-                        r'報酬[：:]\s*([0-9,]+[万円円]+)',
-                        r'([0-9,]+[万円円]+)',
+                    tree = lxml_html.fromstring(html_content)
+                    # ラベル候補要素のテキストは1回の走査でまとめて取り出す
+                    candidates = [
+                        (el, el.text_content().strip())
+                        for el in tree.iter("dt", "th", "label", "span")
                     ]
-                    for pattern in price_patterns:
-                        match = re.search(pattern, page_text)
-                        if match:
-                            job_info["price"] = match.group(1) if match.lastindex else match.group(0)
-                            break
-                except:
-                    pass
-            
-            # 価格が取得できなかった場合、「予算」というテキストの近くを探す
-            if not job_info["price"]:
-                try:
-                    budget_elem = page.locator("text=予算").first
-                    if budget_elem.count() > 0:
-                        # 親要素から価格を取得
-                        parent = budget_elem.locator("..")
-                        if parent.count() > 0:
-                            parent_text = parent.inner_text().strip()
-                            price_match = re.search(r'([0-9,]+[万円円]+)', parent_text)
-                            if price_match:
-                                job_info["price"] = price_match.group(1)
-                except:
-                    pass
-
-            # その他の情報を取得（テキストから抽出を試みる）
-            page_text = page.inner_text("body")
-            
-            # 応募期限を取得（より詳細に）
-            try:
-                deadline_elem = page.locator("text=応募期限").first
-                if deadline_elem.count() > 0:
-                    # 親要素から日付を取得
-                    parent = deadline_elem.locator("..")
-                    if parent.count() > 0:
-                        deadline_text = parent.inner_text().strip()
-                        # 日付パターンを抽出
-                        date_match = re.search(r'応募期限\s*(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', deadline_text)
-                        if date_match:
-                            job_info["deadline"] = date_match.group(1)
-                        elif "応募期限" in deadline_text:
-                            parts = deadline_text.split("応募期限")
-                            if len(parts) > 1:
-                                # 日付パターンを抽出
-                                date_match = re.search(r'(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', parts[1])
-                                if date_match:
-                                    job_info["deadline"] = date_match.group(1)
-                                else:
-                                    job_info["deadline"] = parts[1].strip()[:100]
-                
-                # 応募期限が取得できなかった場合、テキストから直接探す
-                if not job_info["deadline"]:
-                    deadline_match = re.search(r'応募期限\s*(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', page_text)
-                    if deadline_match:
-                        job_info["deadline"] = deadline_match.group(1)
-            except Exception as e:
-                pass
-            
-            # 掲載日を取得（より詳細に）
-            try:
-                posted_elem = page.locator("text=掲載日").first
-                if posted_elem.count() > 0:
-                    parent = posted_elem.locator("..")
-                    if parent.count() > 0:
-                        posted_text = parent.inner_text().strip()
-                        # 日付パターンを抽出
-                        date_match = re.search(r'掲載日\s*(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', posted_text)
-                        if date_match:
-                            job_info["posted_date"] = date_match.group(1)
-                        elif "掲載日" in posted_text:
-                            parts = posted_text.split("掲載日")
-                            if len(parts) > 1:
-                                # 日付パターンを抽出
-                                date_match = re.search(r'(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', parts[1])
-                                if date_match:
-                                    job_info["posted_date"] = date_match.group(1)
-                                else:
-                                    job_info["posted_date"] = parts[1].strip()[:100]
-                
-                # 掲載日が取得できなかった場合、テキストから直接探す
-                if not job_info["posted_date"]:
-                    posted_match = re.search(r'掲載日\s*(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', page_text)
-                    if posted_match:
-                        job_info["posted_date"] = posted_match.group(1)
-            except Exception as e:
-                pass
-            
-            # 応募者数を取得（より詳細に）
-            try:
-                applicants_elem = page.locator("text=応募した人").first
-                if applicants_elem.count() > 0:
-                    # 親要素から取得
-                    parent = applicants_elem.locator("..")
-                    if parent.count() > 0:
-                        applicants_text = parent.inner_text().strip()
-                    else:
-                        applicants_text = applicants_elem.inner_text().strip()
-                    # 「応募した人 XX 人」の形式から数値を抽出
-                    match = re.search(r'応募した人\s*(\d+)\s*人', applicants_text)
-                    if match:
-                        job_info["applicants"] = f"{match.group(1)}人"
-                
-                # 応募者数が取得できなかった場合、テキストから直接探す
-                if not job_info["applicants"]:
-                    applicants_match = re.search(r'応募した人\s*(\d+)\s*人', page_text)
-                    if applicants_match:
-                        job_info["applicants"] = f"{applicants_match.group(1)}人"
-            except Exception as e:
-                pass
-            
-            # カテゴリーを取得（より詳細に）
-            try:
-                # カテゴリーは通常、タイトルの近くやメタ情報に含まれる
-                category_elem = page.locator("text=カテゴリ").first
-                if category_elem.count() > 0:
-                    parent = category_elem.locator("..")
-                    if parent.count() > 0:
-                        category_text = parent.inner_text().strip()
-                        if "カテゴリ" in category_text:
-                            parts = category_text.split("カテゴリ")
-                            if len(parts) > 1:
-                                job_info["category"] = parts[1].strip()[:200]
-                
-                # カテゴリーが取得できなかった場合、titleタグから取得を試みる
-                if not job_info["category"]:
-                    title_tag = page.title()
-                    if "(" in title_tag and ")" in title_tag:
-                        # タイトルに「(カテゴリー名)」の形式で含まれている場合
-                        category_match = re.search(r'\(([^)]+)\)', title_tag)
-                        if category_match:
-                            job_info["category"] = category_match.group(1)
-                
-                # まだ取得できていない場合、説明テキストから抽出
-                if not job_info["category"] and job_info.get("description"):
-                    # 説明の中にカテゴリー情報が含まれている場合
-                    desc_text = job_info["description"]
-                    if "ECサイト制作" in desc_text:
-                        job_info["category"] = "ECサイト制作"
-                    elif "ECサイト" in desc_text:
-                        category_match = re.search(r'(ECサイト[^の\s]+)', desc_text)
-                        if category_match:
-                            job_info["category"] = category_match.group(1)
-            except Exception as e:
-                pass
-            
-            # クライアント情報を取得
-            try:
-                client_elem = page.locator("text=クライアント").first
-                if client_elem.count() > 0:
-                    parent = client_elem.locator("..")
-                    if parent.count() > 0:
-                        client_text = parent.inner_text().strip()
-                        if "クライアント" in client_text:
-                            parts = client_text.split("クライアント")
-                            if len(parts) > 1:
-                                job_info["client_info"] = parts[1].strip()[:200]
-            except:
-                pass
-
-            # 説明テキストから情報を抽出（説明に含まれている情報を個別フィールドに抽出）
-            if job_info.get("description"):
-                desc_text = job_info["description"]
-                
-                # 応募期限を説明から抽出
-                if not job_info.get("deadline"):
-                    deadline_match = re.search(r'応募期限\s*(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', desc_text)
-                    if deadline_match:
-                        job_info["deadline"] = deadline_match.group(1)
-                
-                # 掲載日を説明から抽出
-                if not job_info.get("posted_date"):
-                    posted_match = re.search(r'掲載日\s*(\d{4}年\d{1,2}月\d{1,2}日|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日)', desc_text)
-                    if posted_match:
-                        job_info["posted_date"] = posted_match.group(1)
-                
-                # 応募者数を説明から抽出
-                if not job_info.get("applicants"):
-                    applicants_match = re.search(r'応募した人\s*(\d+)\s*人', desc_text)
-                    if applicants_match:
-                        job_info["applicants"] = f"{applicants_match.group(1)}人"
-                
-                # カテゴリーを説明から抽出
-                if not job_info.get("category"):
-                    if "ECサイト制作" in desc_text:
-                        job_info["category"] = "ECサイト制作"
-                    elif "ECサイト" in desc_text:
-                        category_match = re.search(r'(ECサイト[^の\s]+)', desc_text)
-                        if category_match:
-                            job_info["category"] = category_match.group(1)
-                
-                # 価格を説明から抽出（「報酬」や「予算」のキーワードの後）
-                if not job_info.get("price"):
-                    price_match = re.search(r'(報酬|予算)[：:]\s*([0-9,]+[万円円]+)', desc_text)
-                    if price_match:
-                        job_info["price"] = price_match.group(2)
-                    else:
-                        # より広範囲に金額を探す
-                        price_match = re.search(r'([0-9,]+[万円円]+)', desc_text)
-                        if price_match:
-                            job_info["price"] = price_match.group(1)
+                except Exception:
+                    candidates = []
+
+                def by_label(label: str) -> str:
+                    for el, el_text in candidates:
+                        if el_text == label or label in el_text:
+                            sibling = el.getnext()
+                            target = sibling if sibling is not None else el.getparent()
+                            if target is not None:
+                                value = target.text_content().strip()
+                                if value:
+                                    return value
+                    return ""
+
+                labeled = {
+                    "price": by_label("予算") or by_label("報酬"),
+                    "deadline": by_label("応募期限"),
+                    "posted": by_label("掲載日"),
+                    "applicants": by_label("応募した人"),
+                    "category": by_label("カテゴリ"),
+                    "client": by_label("クライアント"),
+                }
+
+                if not job_info["price"] and labeled.get("price"):
+                    price_match = _PRICE_RE.search(labeled["price"])
+                    job_info["price"] = (
+                        price_match.group(1) if price_match else labeled["price"][:100]
+                    )
+                if not job_info["deadline"] and labeled.get("deadline"):
+                    date_match = _ANY_DATE_RE.search(labeled["deadline"])
+                    job_info["deadline"] = (
+                        date_match.group(1) if date_match else labeled["deadline"][:100]
+                    )
+                if not job_info["posted_date"] and labeled.get("posted"):
+                    date_match = _ANY_DATE_RE.search(labeled["posted"])
+                    job_info["posted_date"] = (
+                        date_match.group(1) if date_match else labeled["posted"][:100]
+                    )
+                if not job_info["applicants"] and labeled.get("applicants"):
+                    num_match = _NUM_RE.search(labeled["applicants"])
+                    if num_match:
+                        job_info["applicants"] = f"{num_match.group(1)}人"
+                if not job_info["category"] and labeled.get("category"):
+                    job_info["category"] = labeled["category"][:200]
+                if not job_info["client_info"] and labeled.get("client"):
+                    job_info["client_info"] = labeled["client"][:200]
 
             return job_info
 
@@ -675,22 +671,20 @@ class CrowdWorksScraper:
         output_path_obj = Path(output_path)
         output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        # すべてのキーを取得
-        all_keys = set()
-        for job in jobs_data:
-            all_keys.update(job.keys())
-        
-        # raw_htmlは除外
-        all_keys.discard("raw_html")
-        fieldnames = sorted(list(all_keys))
-
-        with open(output_path, "w", newline="", encoding=encoding) as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for job in jobs_data:
-                row = {key: job.get(key, "") for key in fieldnames}
-                writer.writerow(row)
+        # 列は固定（全行のキーを集合走査しない）。raw_htmlはdebug時のみ付く
+        fieldnames = list(self.FIELDNAMES)
+        if any("raw_html" in job for job in jobs_data):
+            fieldnames.append("raw_html")
+
+        # 1MiBのバッファでまとめて書き出し、細かいwriteシステムコールを減らす
+        with open(output_path, "w", newline="", encoding=encoding,
+                  buffering=1 << 20) as f:
+            # 行ごとのdict再マップを避け、タプル列をまとめてC実装で書き出す
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                tuple(job.get(key, "") for key in fieldnames) for job in jobs_data
+            )
 
         print(f"CSVファイルを保存しました: {output_path}")
         return str(output_path_obj.absolute())
@@ -40,9 +40,60 @@ with handler:
 """
 
 from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from typing import Optional, List, Dict, Any
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
 import json
+import threading
+
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+
+# fetch_manyの既定の同時実行数（処理はネットワークI/O待ちが支配的）
+MAX_CONCURRENCY = 5
+
+# 同一コンテキストを使い回す上限ページ数。コンテキストのメモリは
+# closeまで解放されないため、定期的に作り直してメモリ使用量を抑える
+CONTEXT_RECYCLE_PAGES = 50
+
+# (URL, XPath)単位の検索結果キャッシュの上限件数
+XPATH_CACHE_SIZE = 128
+
+# DOM・テキスト抽出に不要な重いリソースタイプ（読み込み時に中断する）
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# XPath評価＋要素情報収集の関数をコンテキスト生成時に1回だけ登録する
+# 初期化スクリプト。呼び出しごとに関数定義をまるごと送ってV8に再パース
+# させる代わりに、各ページでは登録済みの__collectByXPathを呼ぶだけで済む
+_XP_COLLECT_INIT_SCRIPT = """
+window.__collectByXPath = (xpath) => {
+    const result = document.evaluate(
+        xpath, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const out = [];
+    for (let i = 0; i < result.snapshotLength; i++) {
+        const el = result.snapshotItem(i);
+        const attrs = {};
+        for (let attr of el.attributes || []) {
+            attrs[attr.name] = attr.value;
+        }
+        const visible = !!(el.offsetParent || el.getClientRects().length);
+        out.push({
+            text: visible ? el.innerText : "",
+            html: el.innerHTML,
+            tag: el.tagName.toLowerCase(),
+            attributes: attrs,
+            visible: visible,
+            enabled: 'disabled' in el ? !el.disabled : null
+        });
+    }
+    return out;
+};
+"""
 
 
 class DomXPathHandler:
@@ -50,18 +101,40 @@ class DomXPathHandler:
     PlaywrightでDOM取得とXPath処理を行うクラス
     """
 
-    def __init__(self, headless: bool = True, browser_type: str = "chromium"):
+    def __init__(self, headless: bool = True, browser_type: str = "chromium",
+                 block_resources: bool = True, fast_mode: bool = False):
         """
         初期化
 
         Args:
             headless: ヘッドレスモードで実行するか
             browser_type: ブラウザタイプ ("chromium", "firefox", "webkit")
+            block_resources: 画像・メディア・フォント・CSSをブロックするか
+                （DOM/テキストしか読まないため既定で有効。転送バイト数と
+                ページあたりのメモリを大きく減らせる）
+            fast_mode: JS実行が不要な静的ページ向けに、ブラウザを使わず
+                HTTP取得＋lxmlでXPath検索するか
         """
         self.headless = headless
         self.browser_type = browser_type
+        self.block_resources = block_resources
+        self.fast_mode = fast_mode
         self.playwright = None
         self.browser: Optional[Browser] = None
+        # ビューポートサイズごとに1つのコンテキストをキャッシュして使い回す
+        # （コンテキスト生成はJS VM初期化・ストレージ準備を伴う固定コスト）
+        self._contexts: Dict[tuple, Any] = {}
+        self._context_uses: Dict[tuple, int] = {}
+        # (url, xpath, ...)をキーにした検索結果のLRUキャッシュ。
+        # テキスト取得と属性取得を同じ(url, xpath)に対して呼んでも、
+        # ナビゲーションとXPath評価は1回で済む。Sync APIのハンドラは
+        # 生成スレッド専用のためロックは不要（スレッド間の合流は
+        # DomXPathPool側のキャッシュが受け持つ）
+        self._xpath_cache: OrderedDict = OrderedDict()
+        # fast_mode用: コンパイル済みXPathのキャッシュと共有HTTPクライアント
+        # （XPathのコンパイルは式ごとに1回、TCP接続はコネクションプールで再利用）
+        self._compiled_xpaths: Dict[str, etree.XPath] = {}
+        self._http: Optional[httpx.Client] = None
 
     def __enter__(self):
         """コンテキストマネージャー開始"""
@@ -80,17 +153,71 @@ class DomXPathHandler:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """コンテキストマネージャー終了"""
+        for context in self._contexts.values():
+            context.close()
+        self._contexts.clear()
+        self._context_uses.clear()
         if self.browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _get_context(self, viewport_size: Optional[Dict[str, int]]):
+        """
+        ビューポートサイズに対応するコンテキストを取得（なければ作成）
+
+        呼び出しごとにnew_context()せず同じコンテキストを使い回すことで、
+        URLあたりの固定コストをページ生成だけに抑えます。コンテキストの
+        メモリはcloseするまで解放されないため、CONTEXT_RECYCLE_PAGES回
+        使ったら作り直します。
+
+        Input:
+            viewport_size: ビューポートサイズ {"width": 1280, "height": 720}
+
+        Output:
+            BrowserContext: キャッシュ済み（または新規作成した）コンテキスト
+        """
+        if not self.browser:
+            raise RuntimeError("Browser not initialized. Use context manager (with statement)")
+
+        viewport = viewport_size or {"width": 1280, "height": 720}
+        key = (viewport["width"], viewport["height"])
+
+        # 使いすぎたコンテキストは閉じて作り直す
+        if key in self._contexts and self._context_uses.get(key, 0) >= CONTEXT_RECYCLE_PAGES:
+            self._contexts.pop(key).close()
+            self._context_uses[key] = 0
+
+        if key not in self._contexts:
+            context = self.browser.new_context(viewport=viewport)
+            # XPath収集関数はコンテキスト単位で1回だけ登録する
+            context.add_init_script(_XP_COLLECT_INIT_SCRIPT)
+            if self.block_resources:
+                # 重いリソースへのリクエストをコンテキスト単位で中断する。
+                # page.routeのハンドラは長時間の実行で溜まっていくため、
+                # 上のリサイクル（close＋作り直し）で定期的に解放される
+                context.route(
+                    "**/*",
+                    lambda route: route.abort()
+                    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+                    else route.continue_()
+                )
+            self._contexts[key] = context
+            self._context_uses[key] = 0
+
+        self._context_uses[key] += 1
+        return self._contexts[key]
 
     def get_page_dom(
         self,
         url: str,
         wait_time: int = 2000,
         viewport_size: Optional[Dict[str, int]] = None,
-        output_format: str = "html"
+        output_format: str = "html",
+        wait_for_selector: Optional[str] = None
     ) -> str:
         """
         指定されたURLのページDOM全体を取得
@@ -100,25 +227,30 @@ class DomXPathHandler:
             wait_time: 読み込み待機時間(ミリ秒)
             viewport_size: ビューポートサイズ {"width": 1280, "height": 720}
             output_format: 出力フォーマット ("html", "text")
+            wait_for_selector: このセレクタの出現を待ってから取得する
+                （指定時はwait_timeを上限とした条件待ちになり、固定待機は行わない）
 
         Output:
             str: ページのDOM内容（HTML or プレーンテキスト）
         """
-        if not self.browser:
-            raise RuntimeError("Browser not initialized. Use context manager (with statement)")
-
-        # ページを作成
-        context = self.browser.new_context(
-            viewport=viewport_size or {"width": 1280, "height": 720}
-        )
-        page = context.new_page()
+        # キャッシュ済みコンテキストを使い回し、ページだけ作る
+        page = self._get_context(viewport_size).new_page()
 
         try:
-            # URLにアクセス
-            page.goto(url, wait_until="networkidle", timeout=30000)
-
-            # 追加の待機時間
-            if wait_time > 0:
+            # networkidleは解析系スクリプトが通信を続けるページでタイムアウト
+            # まで待ち続けるため、DOMが組み上がった時点で先へ進む
+            page.goto(url, wait_until="domcontentloaded", timeout=15000)
+
+            # セレクタ指定時は固定スリープの代わりに要素の出現を待つ
+            # （出現した時点で即座に先へ進み、wait_timeは上限として働く）
+            if wait_for_selector:
+                try:
+                    page.wait_for_selector(
+                        wait_for_selector, state="attached", timeout=wait_time
+                    )
+                except PlaywrightTimeoutError:
+                    pass  # 出現しなくても取得自体は試す
+            elif wait_time > 0:
                 page.wait_for_timeout(wait_time)
 
             # DOM取得
@@ -132,7 +264,7 @@ class DomXPathHandler:
             return content
 
         finally:
-            context.close()
+            page.close()
 
     def find_elements_by_xpath(
         self,
@@ -154,54 +286,130 @@ class DomXPathHandler:
             List[Dict[str, Any]]: 要素情報のリスト
                 [{"text": "...", "html": "...", "tag": "...", "attributes": {...}}]
         """
-        if not self.browser:
-            raise RuntimeError("Browser not initialized. Use context manager (with statement)")
+        # 静的ページ向けモードではブラウザを経由せずHTTP＋lxmlで検索する
+        if self.fast_mode:
+            return self.find_elements_by_xpath_static(url, xpath)
 
-        # ページを作成
-        context = self.browser.new_context(
-            viewport=viewport_size or {"width": 1280, "height": 720}
+        cache_key = (
+            url, xpath, tuple(sorted((viewport_size or {}).items())), wait_time
         )
-        page = context.new_page()
 
+        # 同じ(URL, XPath)の再検索はキャッシュから返す
+        if cache_key in self._xpath_cache:
+            self._xpath_cache.move_to_end(cache_key)
+            return self._xpath_cache[cache_key]
+
+        # キャッシュ済みコンテキストを使い回し、ページだけ作る
+        page = self._get_context(viewport_size).new_page()
         try:
-            # URLにアクセス
-            page.goto(url, wait_until="networkidle", timeout=30000)
+            # networkidleの代わりにDOM構築完了で先へ進む
+            page.goto(url, wait_until="domcontentloaded", timeout=15000)
 
-            # 追加の待機時間
+            # 固定スリープの代わりに対象XPathの要素の出現を待つ
+            # （見つかった時点で即座に先へ進み、wait_timeは上限として働く）
             if wait_time > 0:
-                page.wait_for_timeout(wait_time)
+                try:
+                    page.locator(f"xpath={xpath}").first.wait_for(
+                        state="attached", timeout=wait_time
+                    )
+                except PlaywrightTimeoutError:
+                    pass  # マッチ0件のXPathもあり得るため、そのまま評価する
+
+            # XPathの評価と全要素の情報収集を1回のJS評価で行う
+            # （要素ごとにinner_text/inner_html/evaluate等を呼ぶと、1要素
+            # あたり5〜6回のCDP往復が発生する。ブラウザ内で全件まとめて
+            # 組み立てれば、マッチ数によらず往復は1回で済む）。
+            # 収集関数本体は初期化スクリプトで登録済みのため、ここで
+            # 送るのはXPath文字列と短い呼び出し式だけ
+            results = page.evaluate(
+                "xpath => window.__collectByXPath(xpath)", xpath
+            )
+        finally:
+            page.close()
 
-            # XPathで要素を取得
-            elements = page.locator(f"xpath={xpath}")
-            count = elements.count()
-
-            results = []
-            for i in range(count):
-                element = elements.nth(i)
-
-                # 要素の情報を取得
-                element_info = {
-                    "text": element.inner_text() if element.is_visible() else "",
-                    "html": element.inner_html(),
-                    "tag": element.evaluate("el => el.tagName.toLowerCase()"),
-                    "attributes": element.evaluate(
-                        """el => {
-                            const attrs = {};
-                            for (let attr of el.attributes) {
-                                attrs[attr.name] = attr.value;
-                            }
-                            return attrs;
-                        }"""
-                    ),
-                    "visible": element.is_visible(),
-                    "enabled": element.is_enabled() if element.evaluate("el => 'disabled' in el") else None
-                }
-                results.append(element_info)
+        # 結果をLRUキャッシュに保存し、上限を超えたら最古を捨てる
+        self._xpath_cache[cache_key] = results
+        if len(self._xpath_cache) > XPATH_CACHE_SIZE:
+            self._xpath_cache.popitem(last=False)
 
-            return results
+        return results
 
-        finally:
-            context.close()
+    def find_elements_by_xpath_static(
+        self,
+        url: str,
+        xpath: str,
+        timeout: float = 10.0
+    ) -> List[Dict[str, Any]]:
+        """
+        静的ページをHTTP取得し、lxmlでXPath検索
+
+        JS実行が不要なページでは、ブラウザ→CDP→V8→JSONという往復を
+        丸ごと省き、HTTP取得1回＋プロセス内のC実装（libxml2）で検索
+        できます。XPathは式ごとに1回だけコンパイルして使い回します。
+
+        Input:
+            url: アクセスするURL
+            xpath: XPath式
+            timeout: HTTPタイムアウト(秒)
+
+        Output:
+            List[Dict[str, Any]]: 要素情報のリスト
+                （Playwright経由のfind_elements_by_xpathと同じ形式。
+                レンダリングしないためvisibleは常にTrue扱い）
+        """
+        # HTTPクライアントは初回に作り、コネクションプールを使い回す
+        if self._http is None:
+            self._http = httpx.Client(follow_redirects=True)
+
+        resp = self._http.get(url, timeout=timeout)
+        resp.raise_for_status()
+        tree = lxml_html.fromstring(resp.content)
+
+        # コンパイル済みXPathをキャッシュから取得（なければコンパイルして保存）
+        compiled = self._compiled_xpaths.get(xpath)
+        if compiled is None:
+            compiled = self._compiled_xpaths[xpath] = etree.XPath(xpath)
+
+        results = []
+        for node in compiled(tree):
+            # //a/@href のような属性・テキスト結果は文字列で返る
+            if not hasattr(node, "tag"):
+                results.append({
+                    "text": str(node),
+                    "html": "",
+                    "tag": "",
+                    "attributes": {},
+                    "visible": True,
+                    "enabled": None,
+                })
+                continue
+
+            inner_html = (node.text or "") + "".join(
+                etree.tostring(child, encoding="unicode") for child in node
+            )
+            results.append({
+                "text": node.text_content().strip(),
+                "html": inner_html,
+                "tag": str(node.tag).lower(),
+                "attributes": dict(node.attrib),
+                "visible": True,
+                "enabled": (None if "disabled" not in node.attrib else False),
+            })
+
+        return results
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        XPath検索結果のキャッシュを破棄
+
+        Input:
+            url: 破棄対象のURL（省略時は全件破棄）
+        """
+        if url is None:
+            self._xpath_cache.clear()
+            return
+        for key in [k for k in self._xpath_cache if k[0] == url]:
+            del self._xpath_cache[key]
 
     def get_text_by_xpath(
         self,
@@ -254,7 +462,8 @@ class DomXPathHandler:
         url: str,
         wait_time: int = 2000,
         viewport_size: Optional[Dict[str, int]] = None,
-        max_depth: int = 5
+        max_depth: int = 5,
+        wait_for_selector: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         ページのDOM構造を抽出
@@ -264,6 +473,8 @@ class DomXPathHandler:
             wait_time: 読み込み待機時間(ミリ秒)
             viewport_size: ビューポートサイズ
             max_depth: 最大深度
+            wait_for_selector: このセレクタの出現を待ってから抽出する
+                （指定時はwait_timeを上限とした条件待ちになり、固定待機は行わない）
 
         Output:
             Dict[str, Any]: DOM構造の辞書
@@ -273,62 +484,122 @@ class DomXPathHandler:
                     "children": [...]
                 }
         """
-        if not self.browser:
-            raise RuntimeError("Browser not initialized. Use context manager (with statement)")
-
-        # ページを作成
-        context = self.browser.new_context(
-            viewport=viewport_size or {"width": 1280, "height": 720}
-        )
-        page = context.new_page()
+        # キャッシュ済みコンテキストを使い回し、ページだけ作る
+        page = self._get_context(viewport_size).new_page()
 
         try:
-            # URLにアクセス
-            page.goto(url, wait_until="networkidle", timeout=30000)
-
-            # 追加の待機時間
-            if wait_time > 0:
+            # networkidleの代わりにDOM構築完了で先へ進む
+            page.goto(url, wait_until="domcontentloaded", timeout=15000)
+
+            # セレクタ指定時は固定スリープの代わりに要素の出現を待つ
+            if wait_for_selector:
+                try:
+                    page.wait_for_selector(
+                        wait_for_selector, state="attached", timeout=wait_time
+                    )
+                except PlaywrightTimeoutError:
+                    pass  # 出現しなくても抽出自体は試す
+            elif wait_time > 0:
                 page.wait_for_timeout(wait_time)
 
-            # DOM構造を抽出するJavaScript
-            structure = page.evaluate(f"""
-                (maxDepth) => {{
-                    function extractNode(node, depth) {{
-                        if (depth > maxDepth || !node || node.nodeType !== 1) {{
-                            return null;
-                        }}
-
-                        const attrs = {{}};
-                        for (let attr of node.attributes || []) {{
-                            attrs[attr.name] = attr.value;
-                        }}
-
-                        const children = [];
-                        for (let child of node.children || []) {{
-                            const childNode = extractNode(child, depth + 1);
-                            if (childNode) {{
-                                children.push(childNode);
-                            }}
-                        }}
-
-                        return {{
-                            tag: node.tagName.toLowerCase(),
-                            attributes: attrs,
-                            text: node.childNodes.length === 1 && node.childNodes[0].nodeType === 3
+            # DOMを反復的に走査し、フラットな配列の組（タグ・属性・テキスト・
+            # 親インデックス）で返す。ノードごとの再帰呼び出しとオブジェクト
+            # 生成をなくし、構造キーがノード数ぶん重複しないためCDPを渡る
+            # JSONペイロードも小さくなる。入れ子構造はPython側で復元する
+            flat = page.evaluate(
+                """(maxDepth) => {
+                    const tags = [], attrs = [], texts = [], parents = [];
+                    const queue = [[document.documentElement, 0, -1]];
+                    let head = 0;
+                    while (head < queue.length) {
+                        const [node, depth, parent] = queue[head++];
+                        const idx = tags.length;
+                        tags.push(node.tagName.toLowerCase());
+                        parents.push(parent);
+                        const a = {};
+                        for (let attr of node.attributes || []) {
+                            a[attr.name] = attr.value;
+                        }
+                        attrs.push(a);
+                        texts.push(
+                            node.childNodes.length === 1 && node.childNodes[0].nodeType === 3
                                 ? node.textContent.trim()
-                                : "",
-                            children: children
-                        }};
-                    }}
-
-                    return extractNode(document.documentElement, 0);
-                }}
-            """, max_depth)
+                                : ""
+                        );
+                        if (depth < maxDepth) {
+                            for (let child of node.children || []) {
+                                queue.push([child, depth + 1, idx]);
+                            }
+                        }
+                    }
+                    return {tags: tags, attrs: attrs, texts: texts, parents: parents};
+                }""",
+                max_depth
+            )
+
+            # フラット配列から従来と同じ入れ子の辞書を組み立てる（O(ノード数)）
+            nodes = [
+                {"tag": tag, "attributes": attributes, "text": text, "children": []}
+                for tag, attributes, text in zip(
+                    flat["tags"], flat["attrs"], flat["texts"]
+                )
+            ]
+            structure = None
+            for idx, parent in enumerate(flat["parents"]):
+                if parent == -1:
+                    structure = nodes[idx]
+                else:
+                    nodes[parent]["children"].append(nodes[idx])
 
             return structure
 
         finally:
-            context.close()
+            page.close()
+
+    def fetch_many(
+        self,
+        urls: List[str],
+        xpath: Optional[str] = None,
+        wait_time: int = 2000,
+        viewport_size: Optional[Dict[str, int]] = None,
+        max_concurrency: int = MAX_CONCURRENCY
+    ) -> List[Any]:
+        """
+        複数URLを並列で処理
+
+        URLごとの処理時間はネットワークI/O待ちが支配的なため、逐次ループの
+        N×(読み込み＋待機) が並列化でおよそ ceil(N/同時実行数)×(読み込み＋待機)
+        になります。実体はDomXPathPoolへの委譲で、ワーカースレッドごとに
+        ブラウザを1回だけ起動して担当分のURLで使い回すため、ブラウザの
+        起動コストはURL数ではなくワーカー数にしか比例しません。
+
+        Input:
+            urls: アクセスするURLのリスト
+            xpath: XPath式（指定時は要素検索、省略時はDOM全体を取得）
+            wait_time: 読み込み待機時間(ミリ秒)
+            viewport_size: ビューポートサイズ
+            max_concurrency: 同時実行数
+
+        Output:
+            List[Any]: urlsと同じ順序の結果リスト。xpath指定時は要素情報の
+                リスト、省略時はHTML文字列。失敗したURLの位置には例外
+                オブジェクトが入ります
+        """
+        if not urls:
+            return []
+
+        with DomXPathPool(
+            num_workers=min(max_concurrency, len(urls)),
+            headless=self.headless, browser_type=self.browser_type,
+            block_resources=self.block_resources
+        ) as pool:
+            if xpath is not None:
+                return pool.map_xpath(
+                    urls, xpath, wait_time=wait_time, viewport_size=viewport_size
+                )
+            return pool.map_dom(
+                urls, wait_time=wait_time, viewport_size=viewport_size
+            )
 
     def save_dom_to_file(
         self,
@@ -371,6 +642,173 @@ class DomXPathHandler:
         return str(output_path_obj.absolute())
 
 
+class DomXPathPool:
+    """
+    ウォームアップ済みブラウザを持つワーカープール
+
+    fetch_manyはURLごとにブラウザを起動・終了するため、1件あたり1〜2秒の
+    起動コストを毎回払います。こちらはワーカースレッドごとにブラウザを
+    1回だけ起動して使い回すため、バッチ処理ではタスクあたりの固定コストが
+    ページ生成だけになります。PlaywrightのSync APIオブジェクトは生成
+    スレッドに束縛されるため、ハンドラはスレッドローカルに保持します。
+
+    【使用方法】
+    with DomXPathPool(num_workers=4) as pool:
+        results = pool.map_xpath(urls, "//h1")
+    """
+
+    def __init__(self, num_workers: int = 4, headless: bool = True,
+                 browser_type: str = "chromium", block_resources: bool = True):
+        """
+        初期化
+
+        Args:
+            num_workers: ワーカースレッド数（＝起動するブラウザ数）
+            headless: ヘッドレスモードで実行するか
+            browser_type: ブラウザタイプ ("chromium", "firefox", "webkit")
+            block_resources: 画像・メディア・フォント・CSSをブロックするか
+        """
+        self._num_workers = num_workers
+        self._headless = headless
+        self._browser_type = browser_type
+        self._block_resources = block_resources
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+        # ワーカー間で共有する(URL, XPath)検索結果のキャッシュと、実行中
+        # リクエストのFuture。各ハンドラのLRUキャッシュはスレッドローカル
+        # で共有されないため、同時リクエストが実際に合流するのはここ。
+        # 同じ(url, xpath)への同時リクエストは先行の1回の取得に相乗りする
+        self._result_cache: OrderedDict = OrderedDict()
+        self._inflight: Dict[tuple, Future] = {}
+        self._cache_lock = threading.Lock()
+        # 全ワーカーを先に起動してブラウザをウォームアップしておく
+        # （バリアで待ち合わせ、各スレッドが必ず1回ずつ初期化を実行する）
+        self._run_on_all_workers(self._init_worker)
+
+    def __enter__(self):
+        """コンテキストマネージャー開始"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """コンテキストマネージャー終了"""
+        self.close()
+
+    def _run_on_all_workers(self, fn) -> None:
+        """全ワーカースレッドでfnを1回ずつ実行する"""
+        barrier = threading.Barrier(self._num_workers)
+
+        def task():
+            barrier.wait()
+            fn()
+
+        futures = [self._executor.submit(task) for _ in range(self._num_workers)]
+        for future in futures:
+            future.result()
+
+    def _init_worker(self) -> None:
+        """このスレッド専用のハンドラ（＋ブラウザ）を起動する"""
+        self._local.handler = DomXPathHandler(
+            headless=self._headless, browser_type=self._browser_type,
+            block_resources=self._block_resources
+        ).__enter__()
+
+    def _close_worker(self) -> None:
+        """このスレッドのハンドラを終了する"""
+        handler = getattr(self._local, "handler", None)
+        if handler is not None:
+            handler.__exit__(None, None, None)
+            self._local.handler = None
+
+    def map_xpath(self, urls: List[str], xpath: str, **kwargs) -> List[Any]:
+        """
+        複数URLに同じXPath検索を並列実行
+
+        バッチ内（および呼び出しをまたいで）重複するURLは二重に取得せず、
+        先行の1回の取得に相乗りして同じ結果を共有します。
+
+        Input:
+            urls: アクセスするURLのリスト
+            xpath: XPath式
+            **kwargs: find_elements_by_xpathに渡す追加引数
+
+        Output:
+            List[Any]: urlsと同じ順序の要素情報リスト。失敗したURLの
+                位置には例外オブジェクトが入ります
+        """
+        def task(url: str) -> Any:
+            key = (
+                url, xpath,
+                tuple(sorted((kwargs.get("viewport_size") or {}).items())),
+                kwargs.get("wait_time", 2000),
+            )
+
+            # キャッシュ済みなら返し、同じ検索が実行中ならそのFutureを待つ
+            with self._cache_lock:
+                if key in self._result_cache:
+                    self._result_cache.move_to_end(key)
+                    return self._result_cache[key]
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    inflight = Future()
+                    self._inflight[key] = inflight
+                    is_owner = True
+                else:
+                    is_owner = False
+
+            if not is_owner:
+                try:
+                    return inflight.result()
+                except Exception as e:
+                    return e
+
+            try:
+                result = self._local.handler.find_elements_by_xpath(url, xpath, **kwargs)
+            except Exception as e:
+                # 相乗りしている待機側にも同じ例外を伝えたうえで、
+                # 結果の位置に例外を入れて返す（全体は落とさない）
+                inflight.set_exception(e)
+                with self._cache_lock:
+                    self._inflight.pop(key, None)
+                return e
+
+            # キャッシュへの挿入・削除はロック下で行い、完了後にFutureを解決する
+            with self._cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > XPATH_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+                self._inflight.pop(key, None)
+            inflight.set_result(result)
+            return result
+
+        return list(self._executor.map(task, urls))
+
+    def map_dom(self, urls: List[str], **kwargs) -> List[Any]:
+        """
+        複数URLのDOM全体を並列取得
+
+        Input:
+            urls: アクセスするURLのリスト
+            **kwargs: get_page_domに渡す追加引数
+
+        Output:
+            List[Any]: urlsと同じ順序のHTML文字列リスト。失敗したURLの
+                位置には例外オブジェクトが入ります
+        """
+        def task(url: str) -> Any:
+            try:
+                return self._local.handler.get_page_dom(url, **kwargs)
+            except Exception as e:
+                # 1件の失敗で全体を落とさず、結果の位置に例外を入れて返す
+                return e
+
+        return list(self._executor.map(task, urls))
+
+    def close(self) -> None:
+        """全ワーカーのブラウザを終了し、プールを停止する"""
+        self._run_on_all_workers(self._close_worker)
+        self._executor.shutdown(wait=True)
+
+
 def quick_xpath_search(url: str, xpath: str, **kwargs) -> List[Dict[str, Any]]:
     """
     クイックXPath検索（コンテキストマネージャー不要）
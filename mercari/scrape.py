@@ -11,7 +11,8 @@ python3 mercari/scrape.py
 import sys
 import os
 from pathlib import Path
-import time
+
+from tqdm import tqdm
 
 # 親ディレクトリのパスを追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,7 +26,7 @@ elif os.path.exists(os.path.expanduser('~/playwright-browsers')):
     os.environ['PLAYWRIGHT_BROWSERS_PATH'] = os.path.expanduser('~/playwright-browsers')
 
 from mercari.scraper import MercariScraper
-from common.utils import save_to_csv
+from common.utils import CsvSink, RateLimiter
 
 
 def main():
@@ -63,23 +64,30 @@ def main():
             print(f"{min(max_items, len(item_links))} 件の商品情報を取得します...\n")
 
             # 商品情報を取得（404エラーの場合は次の商品を試す）
+            # 固定スリープの代わりに最小間隔だけを保証する
+            # （ページ取得に3秒以上かかった場合は待たない）
+            rate_limiter = RateLimiter(min_interval=3.0)
             successful_count = 0
             attempt_count = 0
             max_attempts = max_items * 3  # 最大試行回数（404エラーを考慮）
-            
-            for i, item_url in enumerate(item_links):
+
+            # 取得できた商品から1件ずつCSVに書き込む
+            # （途中で落ちてもそれまでの結果がファイルに残る）
+            output_path = Path(__file__).parent / "output" / "mercari_items.csv"
+            csv_sink = CsvSink(str(output_path))
+
+            # 進捗・ETAの描画はtqdmに任せる（商品ごとのバナー出力を置き換え）
+            progress = tqdm(total=max_items, desc="商品取得", unit="件")
+            for item_url in item_links:
                 if successful_count >= max_items:
                     break
-                
+
+                rate_limiter.wait()
                 attempt_count += 1
                 if attempt_count > max_attempts:
                     print(f"\n⚠️  最大試行回数に達しました。{successful_count}件のデータを取得しました。")
                     break
-                
-                print(f"\n{'='*60}")
-                print(f"商品 {successful_count + 1}/{max_items} を取得中... (試行 {attempt_count})")
-                print('='*60)
-                
+
                 try:
                     item_info = scraper.scrape_detail(item_url)
                 except Exception as e:
@@ -91,23 +99,20 @@ def main():
                     title = item_info.get('title', '')
                     if title and "cookie" not in title.lower() and "privacy" not in title.lower() and len(title) > 5:
                         items_data.append(item_info)
+                        csv_sink.write(item_info)
                         successful_count += 1
+                        progress.update(1)
                         print(f"\n✓ 取得完了: {item_info.get('title', 'タイトル不明')[:50]}")
                     else:
                         print(f"\n⚠️  商品情報が正しく取得できませんでした（タイトル: {title[:50]}）")
                 else:
                     print(f"\n⚠️  商品情報の取得に失敗しました（404エラー、CAPTCHA、またはその他の問題）")
 
-                # 次のリクエスト前に少し待機
-                if successful_count < max_items:
-                    print("\n3秒待機中...")
-                    time.sleep(3)
+            progress.close()
+            csv_sink.close()
 
-            # 結果を表示・保存
+            # 結果を表示
             if items_data:
-                output_path = Path(__file__).parent / "output" / "mercari_items.csv"
-                save_to_csv(items_data, str(output_path))
-                
                 print("\n" + "=" * 60)
                 print("取得結果")
                 print("=" * 60)
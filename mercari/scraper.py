@@ -33,8 +33,11 @@ class MercariScraper(BaseScraper):
         Output:
             List[str]: 商品詳細ページのURLリスト
         """
-        page = self.get_page()
+        # 画像・フォント・メディア等はテキスト抽出に不要なためブロックする
+        # （詳細ページは画像が大半を占めるため読み込みが大幅に軽くなる）
+        page = self.get_page(block_resources=True)
         item_links = []
+        seen = set()  # O(1)の重複チェック用
 
         try:
             print(f"商品一覧ページにアクセス中: {url}")
@@ -218,7 +221,8 @@ class MercariScraper(BaseScraper):
                                             full_url = f"https://www.mercari.com/{href}"
                                         
                                         # 重複チェック
-                                        if full_url not in item_links:
+                                        if full_url not in seen:
+                                            seen.add(full_url)
                                             item_links.append(full_url)
                                             print(f"  商品リンク {len(item_links)}: {full_url}")
                             except Exception as e:
@@ -303,7 +307,8 @@ class MercariScraper(BaseScraper):
                                 else:
                                     continue
                                 
-                                if full_url not in item_links:
+                                if full_url not in seen:
+                                    seen.add(full_url)
                                     item_links.append(full_url)
                                     print(f"  商品リンク {len(item_links)}: {full_url}")
                 
@@ -322,7 +327,7 @@ class MercariScraper(BaseScraper):
             import traceback
             traceback.print_exc()
         finally:
-            page.context.close()
+            self.release_page(page)
 
         return item_links
 
@@ -337,7 +342,8 @@ class MercariScraper(BaseScraper):
         Output:
             Dict[str, Any]: 商品情報の辞書
         """
-        page = self.get_page()
+        # 画像のダウンロードはブロックしても<img>のsrc属性は取得できる
+        page = self.get_page(block_resources=True)
 
         try:
             print(f"\n商品詳細ページにアクセス中: {item_url}")
@@ -829,4 +835,4 @@ class MercariScraper(BaseScraper):
             traceback.print_exc()
             return None
         finally:
-            page.context.close()
+            self.release_page(page)
@@ -18,22 +18,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 # 実際のインストールは run_scraping 関数内で実行
 
 from mercari.scraper import MercariScraper
-from common.utils import save_to_csv
+from common.price import extract_price
+from common.utils import save_to_csv, RateLimiter
 import time
-import re
-
-
-def extract_price(price_str: str) -> float:
-    """価格文字列から数値を抽出"""
-    if not price_str:
-        return float('inf')
-    price_match = re.search(r'[\d,]+', price_str.replace(',', ''))
-    if price_match:
-        try:
-            return float(price_match.group().replace(',', ''))
-        except:
-            return float('inf')
-    return float('inf')
 
 
 def run_scraping(search_keyword: str, max_items: int, compare_with_amazon: bool):
@@ -107,14 +94,18 @@ def run_scraping(search_keyword: str, max_items: int, compare_with_amazon: bool)
             status_text = st.empty()
             
             # 商品情報を取得
+            # 固定スリープの代わりに最小間隔だけを保証する
+            # （ページ取得に1秒以上かかった場合は待たない）
+            rate_limiter = RateLimiter(min_interval=1.0)
             successful_count = 0
             for i, item_url in enumerate(item_links[:max_items * 2]):  # 余裕を持って取得
                 if successful_count >= max_items:
                     break
-                
+
                 status_text.text(f"商品 {successful_count + 1}/{max_items} を取得中... ({i+1}/{len(item_links)})")
                 progress_bar.progress((i + 1) / min(len(item_links), max_items * 2))
-                
+
+                rate_limiter.wait()
                 try:
                     item_info = scraper.scrape_detail(item_url)
                     if item_info:
@@ -125,9 +116,7 @@ def run_scraping(search_keyword: str, max_items: int, compare_with_amazon: bool)
                 except Exception as e:
                     st.warning(f"エラー: {e}")
                     continue
-                
-                time.sleep(1)  # リクエスト間隔
-            
+
             progress_bar.progress(1.0)
             status_text.text("完了！")
         